@@ -0,0 +1,273 @@
+"""Offline benchmark of the injectors against simulated oracles backed by SQLite
+
+Every oracle answers from an in-memory SQLite database after a simulated latency,
+so the extraction strategies can be compared by the requests they send
+"""
+from __future__ import annotations
+from argparse import ArgumentParser
+from asyncio import run, sleep
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from hashlib import md5
+from random import Random
+from sqlite3 import Connection, connect
+from time import time
+from typing import Any
+from sqlinjectlib import (
+    SQL,
+    BlindInjector,
+    NaryInjector,
+    SimpleQuery,
+    SQLite,
+    Table,
+    TimeInjector,
+    UnionInjector,
+    BigramModel,
+    HEX,
+    SQLInjector,
+)
+
+QUERY = "select id,name,password from users"
+
+
+class BenchmarkSQLite(SQLite):
+    """SQLite with the sleep function registered by the oracles"""
+
+    def sleep(self, time: SQL[int], /) -> SQL[int]:
+        return SQL(f"sleep({time})")
+
+
+@dataclass
+class Oracle:
+    """Simulated target that answers from a SQLite database and keeps count of the requests"""
+
+    connection: Connection
+    latency: float
+    jitter: float
+    errors: float
+    random: Random
+    requests: int = 0
+    in_flight: int = 0
+    peak: int = 0
+    pauses: list[float] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.connection.create_function("sleep", 1, self.__sleep)
+
+    def __sleep(self, seconds: float) -> int:
+        self.pauses.append(float(seconds))
+        return 0
+
+    async def execute(self, query: str) -> list[Any]:
+        self.requests += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.pauses.clear()
+        try:
+            rows = self.connection.execute(query).fetchall()
+            pause = sum(self.pauses)
+            await sleep(self.latency + self.random.uniform(0, self.jitter) + pause)
+        finally:
+            self.in_flight -= 1
+        return rows
+
+    def flip(self, value: bool) -> bool:
+        return not value if self.random.random() < self.errors else value
+
+    async def base(self, query: SimpleQuery) -> list[str | None]:
+        rows = await self.execute(str(query))
+        return [None if row[0] is None else str(row[0]) for row in rows]
+
+    async def union(self, sql: SQL[str]) -> str | None:
+        return (await self.execute(f"select {sql}"))[0][0]
+
+    async def blind(self, sql: SQL[bool]) -> bool:
+        return self.flip(await self.execute(f"select 1 where {sql}") == [(1,)])
+
+    async def nary(self, sql: SQL[int]) -> int:
+        return (await self.execute(f"select {sql}"))[0][0]
+
+    async def time(self, sql: SQL[int]) -> None:
+        await self.execute(f"select {sql}")
+
+
+def database(rows: int, seed: int) -> Connection:
+    generator = Random(seed)
+    names = ["admin", "guest", "alice", "bob", "root", "service", "test", "user"]
+    connection = connect(":memory:")
+    connection.execute("create table users(id integer, name text, password text)")
+    connection.executemany(
+        "insert into users values (?,?,?)",
+        [
+            (
+                i,
+                f"{generator.choice(names)}{i}",
+                None
+                if generator.random() < 0.1
+                else md5(f"{seed}-{i}".encode()).hexdigest(),
+            )
+            for i in range(rows)
+        ],
+    )
+    return connection
+
+
+Factory = Callable[[Oracle, bool], SQLInjector]
+
+INJECTORS: dict[str, Factory] = {
+    "basic": lambda o, c: SQLInjector(
+        o.base, concurrent=c, database_type=BenchmarkSQLite()
+    ),
+    "union": lambda o, c: UnionInjector(
+        o.union, concurrent=c, database_type=BenchmarkSQLite()
+    ),
+    "union batch": lambda o, c: UnionInjector(
+        o.union, concurrent=c, database_type=BenchmarkSQLite(), batch=16
+    ),
+    "union pack": lambda o, c: UnionInjector(
+        o.union, concurrent=c, database_type=BenchmarkSQLite(), pack=True
+    ),
+    "blind": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite()
+    ),
+    "blind window": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), window=8
+    ),
+    "blind length first": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), length_first=True
+    ),
+    "blind pack": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), pack=True
+    ),
+    "blind length first pack": lambda o, c: BlindInjector(
+        o.blind,
+        concurrent=c,
+        database_type=BenchmarkSQLite(),
+        length_first=True,
+        pack=True,
+    ),
+    "blind bigram": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), model=BigramModel()
+    ),
+    "blind hex": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), model=HEX
+    ),
+    "blind verify": lambda o, c: BlindInjector(
+        o.blind, concurrent=c, database_type=BenchmarkSQLite(), verify=True
+    ),
+    "nary 4": lambda o, c: NaryInjector(
+        o.nary, 4, concurrent=c, database_type=BenchmarkSQLite()
+    ),
+    "nary 4 pack": lambda o, c: NaryInjector(
+        o.nary, 4, concurrent=c, database_type=BenchmarkSQLite(), pack=True
+    ),
+    "time": lambda o, c: TimeInjector(
+        o.time,
+        concurrent=c,
+        database_type=BenchmarkSQLite(),
+        interval=0.05,
+    ),
+    "time adaptive": lambda o, c: TimeInjector(
+        o.time,
+        concurrent=c,
+        database_type=BenchmarkSQLite(),
+        interval=0.05,
+        adaptive=True,
+    ),
+}
+
+
+async def benchmark(
+    name: str,
+    rows: int,
+    seed: int,
+    latency: float,
+    jitter: float,
+    errors: float,
+    concurrent: bool,
+) -> list[str]:
+    connection = database(rows, seed)
+    expected = [
+        [None if value is None else str(value) for value in row]
+        for row in connection.execute(QUERY).fetchall()
+    ]
+    oracle = Oracle(connection, latency, jitter, errors, Random(seed))
+    injector = INJECTORS[name](oracle, concurrent)
+    start = time()
+    try:
+        result = [list(row) for row in await injector.query(QUERY)]
+        correct = str(result == expected)
+    except Exception as e:
+        correct = type(e).__name__
+    elapsed = time() - start
+    characters = sum(len(value) for row in expected for value in row if value)
+    return [
+        name,
+        correct,
+        str(oracle.requests),
+        f"{oracle.requests / max(len(expected), 1):.1f}",
+        f"{oracle.requests / max(characters, 1):.2f}",
+        f"{elapsed:.2f}",
+        str(oracle.peak),
+    ]
+
+
+async def main() -> None:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "injectors", nargs="*", help="the injectors to run, all if empty"
+    )
+    parser.add_argument("--rows", type=int, default=20, help="the rows of the table")
+    parser.add_argument(
+        "--seed", type=int, default=0, help="the seed of the data and the noise"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.001, help="the seconds every request takes"
+    )
+    parser.add_argument(
+        "--jitter",
+        type=float,
+        default=0,
+        help="the most random seconds added to the latency",
+    )
+    parser.add_argument(
+        "--errors",
+        type=float,
+        default=0,
+        help="the probability a blind answer is wrong",
+    )
+    parser.add_argument(
+        "--concurrent", action="store_true", help="send the requests concurrently"
+    )
+    args = parser.parse_args()
+    names = args.injectors or list(INJECTORS)
+    rows = [
+        await benchmark(
+            name,
+            args.rows,
+            args.seed,
+            args.latency,
+            args.jitter,
+            args.errors,
+            args.concurrent,
+        )
+        for name in names
+    ]
+    print(
+        Table(
+            [
+                "injector",
+                "correct",
+                "requests",
+                "per row",
+                "per char",
+                "seconds",
+                "in flight",
+            ],
+            rows,
+        )
+    )
+
+
+if __name__ == "__main__":
+    run(main())
@@ -3,6 +3,7 @@ from sqlinjectlib._blindinject import BlindInjector
 from sqlinjectlib._databases import MySQL, DatabaseType, SQLite
 from sqlinjectlib._sqlinjectlib import SQLInjector as SQLInjector, InjectorFunction
 from sqlinjectlib._table import Table
+from sqlinjectlib._schema import Schema
 from sqlinjectlib._typedql import (
     SimpleQuery,
     SQL,
@@ -13,7 +14,39 @@ from sqlinjectlib._typedql import (
     SQLException,
 )
 from sqlinjectlib._unioninject import UnionInjector
+from sqlinjectlib._scheduler import Scheduler, priority, MAX_IN_FLIGHT
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._balancer import Balancer
+from sqlinjectlib._metrics import ProbeEvent, Hook, Metrics, Trace, phase
+from sqlinjectlib._encodings import (
+    Encoding,
+    HexEncoding,
+    Base64Encoding,
+    CompressedEncoding,
+)
+from sqlinjectlib._models import (
+    CharacterModel,
+    Charset,
+    AutoCharset,
+    DIGITS,
+    HEX,
+    UPPER_HEX,
+    BASE64,
+    PRINTABLE,
+    BigramModel,
+    IDENTIFIERS,
+    PREFIXES,
+)
 from sqlinjectlib._timeinject import TimeInjector
+from sqlinjectlib._http import (
+    HTTPRequest,
+    client,
+    contains,
+    status_code,
+    longer_than,
+    between,
+)
+from sqlinjectlib._naryinject import NaryInjector
 
 __all__ = [
     "BlindInjector",
@@ -22,6 +55,7 @@ __all__ = [
     "SQLite",
     "InjectorFunction",
     "Table",
+    "Schema",
     "SimpleQuery",
     "SQL",
     "Query",
@@ -31,4 +65,36 @@ __all__ = [
     "SQLException",
     "UnionInjector",
     "TimeInjector",
+    "NaryInjector",
+    "HTTPRequest",
+    "client",
+    "contains",
+    "status_code",
+    "longer_than",
+    "between",
+    "Scheduler",
+    "priority",
+    "MAX_IN_FLIGHT",
+    "Cache",
+    "Balancer",
+    "ProbeEvent",
+    "Hook",
+    "Metrics",
+    "Trace",
+    "phase",
+    "Encoding",
+    "HexEncoding",
+    "Base64Encoding",
+    "CompressedEncoding",
+    "CharacterModel",
+    "Charset",
+    "AutoCharset",
+    "DIGITS",
+    "HEX",
+    "UPPER_HEX",
+    "BASE64",
+    "PRINTABLE",
+    "BigramModel",
+    "IDENTIFIERS",
+    "PREFIXES",
 ]
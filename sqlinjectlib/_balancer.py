@@ -0,0 +1,109 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from time import monotonic
+from typing import Generic, TypeVar
+from sqlinjectlib._sqlinjectlib import InjectorFunction
+from sqlinjectlib._utils import wrap
+
+A = TypeVar("A")
+V = TypeVar("V")
+
+
+class Balancer(Generic[A, V]):
+    """Injector function that spreads the requests over equivalent injector functions
+
+    Each request is sent to the function expected to answer first,
+    given its latency and the requests it is already answering.
+    A function that keeps failing is left out for a while and its requests are sent to the others,
+    so the results are the same as with a single function
+    """
+
+    def __init__(
+        self,
+        injectors: Sequence[InjectorFunction[A, V]],
+        /,
+        *,
+        executor: Executor | None = None,
+        failures: int = 3,
+        cooldown: float = 30,
+        smoothing: float = 0.2,
+    ):
+        """
+        - injectors: the equivalent injector functions, for example on different hosts
+        - executor: the executor that runs the injectors that are not coroutine functions,
+            a ProcessPoolExecutor spreads the work over processes if the injectors can be pickled
+        - failures: the number of consecutive failures after which a function is left out
+        - cooldown: the seconds a function is left out
+        - smoothing: the weight of the last latency in the average latency of a function
+        - raises ValueError: if there are no injectors
+        """
+        if not injectors:
+            raise ValueError("At least an injector is needed")
+        self.__injectors = [wrap(injector, None, executor) for injector in injectors]
+        self.__failures = failures
+        self.__cooldown = cooldown
+        self.__smoothing = smoothing
+        self.__latencies = [0.0] * len(injectors)
+        self.__in_flight = [0] * len(injectors)
+        self.__consecutive = [0] * len(injectors)
+        self.__ejected = [0.0] * len(injectors)
+
+    @property
+    def latencies(self) -> list[float]:
+        """The average latency of each function in seconds, zero if not measured yet"""
+        return list(self.__latencies)
+
+    @property
+    def available(self) -> list[bool]:
+        """If each function is receiving requests or it is left out"""
+        now = monotonic()
+        return [ejected <= now for ejected in self.__ejected]
+
+    def __choose(self, tried: set[int]) -> int | None:
+        available = self.available
+        candidates = [
+            i for i in range(len(self.__injectors)) if i not in tried and available[i]
+        ]
+        if not candidates:
+            if tried:
+                return None
+            return min(range(len(self.__injectors)), key=self.__ejected.__getitem__)
+        return min(
+            candidates,
+            key=lambda i: (self.__in_flight[i] + 1) * self.__latencies[i],
+        )
+
+    async def __call__(self, arg: A, /) -> V:
+        tried: set[int] = set()
+        error: Exception | None = None
+        while True:
+            index = self.__choose(tried)
+            if index is None:
+                assert error is not None
+                raise error
+            tried.add(index)
+            start = monotonic()
+            self.__in_flight[index] += 1
+            try:
+                result = await self.__injectors[index](arg)
+            except Exception as e:
+                self.__consecutive[index] += 1
+                if self.__consecutive[index] >= self.__failures:
+                    self.__ejected[index] = monotonic() + self.__cooldown
+                error = e
+                continue
+            finally:
+                self.__in_flight[index] -= 1
+            latency = monotonic() - start
+            self.__consecutive[index] = 0
+            if self.__latencies[index] == 0:
+                self.__latencies[index] = latency
+            else:
+                self.__latencies[index] += self.__smoothing * (
+                    latency - self.__latencies[index]
+                )
+            return result
+
+    def __repr__(self) -> str:
+        return f"Balancer({len(self.__injectors)} injectors)"
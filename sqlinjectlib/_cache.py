@@ -0,0 +1,98 @@
+from __future__ import annotations
+from collections.abc import Awaitable, Callable
+from json import dumps, loads
+from sqlite3 import connect
+from typing import Any, TypeVar
+
+A = TypeVar("A")
+V = TypeVar("V")
+
+
+class Cache:
+    """Persistent cache of the results obtained from a target, stored in a SQLite file
+
+    Results are stored by target, kind of request and text of the expression,
+    so a new session against the same target doesn't send the requests already answered
+    """
+
+    def __init__(self, path: str, target: str, /):
+        """
+        - path: the file where the results are stored, it is created if missing
+        - target: the name of the target, the results of different targets are kept separate
+        """
+        self.__connection = connect(path, isolation_level=None)
+        self.__connection.execute("pragma journal_mode=wal")
+        self.__connection.execute("pragma synchronous=normal")
+        self.__connection.execute(
+            "create table if not exists results"
+            "(target text, kind text, expression text, value text,"
+            " primary key (target, kind, expression))"
+        )
+        self.__path = path
+        self.__target = target
+
+    @property
+    def target(self) -> str:
+        """The name of the target"""
+        return self.__target
+
+    def get(self, kind: str, expression: str, /) -> tuple[bool, Any]:
+        """Gets a stored result
+
+        - kind: the kind of request
+        - expression: the text of the expression
+        - returns: if the result was found and the result, None if it wasn't found
+        """
+        row = self.__connection.execute(
+            "select value from results where target=? and kind=? and expression=?",
+            (self.__target, kind, expression),
+        ).fetchone()
+        if row is None:
+            return (False, None)
+        return (True, loads(row[0]))
+
+    def set(self, kind: str, expression: str, value: Any, /) -> None:
+        """Stores a result, replacing the old one if present
+
+        - kind: the kind of request
+        - expression: the text of the expression
+        - value: the result, it must be serializable as json
+        """
+        self.__connection.execute(
+            "insert or replace into results values (?,?,?,?)",
+            (self.__target, kind, expression, dumps(value)),
+        )
+
+    def clear(self) -> None:
+        """Removes all the results of the target"""
+        self.__connection.execute(
+            "delete from results where target=?", (self.__target,)
+        )
+
+    def close(self) -> None:
+        """Closes the underlying file"""
+        self.__connection.close()
+
+    def wrap(
+        self, function: Callable[[A], Awaitable[V]], kind: str, /
+    ) -> Callable[[A], Awaitable[V]]:
+        """Caches the results of a function
+
+        - function: the function that sends the request
+        - kind: the kind of request the function sends
+        - returns: a function that sends the request only if the result isn't stored
+        """
+
+        async def result(arg: A) -> V:
+            expression = str(arg)
+            found, value = self.get(kind, expression)
+            if found:
+                return value
+            value = await function(arg)
+            self.set(kind, expression, value)
+            return value
+
+        return result
+
+    def __repr__(self) -> str:
+        return f"Cache({self.__path!r}, {self.__target!r})"
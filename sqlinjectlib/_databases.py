@@ -1,7 +1,7 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
-from sqlinjectlib._typedql import SimpleQuery, SQL, Char, SQLType
+from sqlinjectlib._typedql import Query, SimpleQuery, SQL, Char, SQLType
 
 
 class DatabaseType(ABC):
@@ -33,6 +33,20 @@ class DatabaseType(ABC):
         """
         ...
 
+    @property
+    def system_databases(self) -> tuple[str, ...]:
+        """The databases that belong to the dbms itself"""
+        return ()
+
+    def get_schema(self, system: bool, /) -> Query:
+        """Creates a query to list every column of every table in a single pass
+
+        - system: if the columns of the system databases are listed
+        - returns: a Query with the database, the table and the column in each row
+        - raises NotImplementedError: if the database has no such query
+        """
+        raise NotImplementedError(f"{self} has no query to list every column")
+
     @abstractmethod
     def ascii(self, sql: SQL[Char], /) -> SQL[int]:
         """Creates a query that converts a char into its ascii representation
@@ -65,6 +79,60 @@ class DatabaseType(ABC):
         """
         ...
 
+    def length(self, sql: SQL[str], /) -> SQL[int]:
+        """Creates a query that returns the number of characters of a string
+
+        - sql: the source query
+        - returns: a query that returns the length of the result of the given query
+        """
+        return SQL(f"length({sql})")
+
+    def concat(self, *sqls: SQL[str]) -> SQL[str]:
+        """Creates a query that joins strings
+
+        - sqls: the queries to join
+        - returns: a query that returns the results of the given queries joined, null if any of them is null
+        """
+        return SQL(f"concat({','.join(str(sql) for sql in sqls)})")
+
+    def group_concat(self, sql: SQL[str], /) -> SQL[str]:
+        """Creates an aggregate query that joins the strings of all the rows without a separator
+
+        - sql: the query evaluated on each row
+        - returns: a query that returns the results of the given query joined, skipping nulls
+        - raises NotImplementedError: if the database has no aggregate concatenation
+        """
+        raise NotImplementedError(f"{self} has no aggregate concatenation")
+
+    def hex(self, sql: SQL[str], /) -> SQL[str]:
+        """Creates a query that encodes the bytes of a string as hexadecimal digits
+
+        - sql: the source query
+        - returns: a query that returns the hexadecimal representation of the result of the given query
+        """
+        return SQL(f"hex({sql})")
+
+    def base64(self, sql: SQL[str], /) -> SQL[str]:
+        """Creates a query that encodes the bytes of a string in base64
+
+        - sql: the source query
+        - returns: a query that returns the base64 representation of the result of the given query
+        - raises NotImplementedError: if the database can't encode in base64
+        """
+        raise NotImplementedError(f"{self} has no base64 function")
+
+    def compress(self, sql: SQL[str], /) -> SQL[str]:
+        """Creates a query that compresses a string
+
+        The result must be the length of the string as 4 bytes little endian followed by its zlib compression,
+        or an empty string if the string is empty
+
+        - sql: the source query
+        - returns: a query that returns the compressed bytes of the result of the given query
+        - raises NotImplementedError: if the database can't compress
+        """
+        raise NotImplementedError(f"{self} has no compress function")
+
     def parse_columns(self, columns: list[str], /) -> list[str]:
         """Post processes the columns obtained by resolving the get_columns query
 
@@ -101,9 +169,40 @@ class MySQL(DatabaseType):
             SQL("table_name") @ SQL.str(table),
         )
 
+    @property
+    def system_databases(self) -> tuple[str, ...]:
+        return ("information_schema", "mysql", "performance_schema", "sys")
+
+    def get_schema(self, system: bool, /) -> Query:
+        return Query(
+            [
+                SQL.column("table_schema"),
+                SQL.column("table_name"),
+                SQL.column("column_name"),
+            ],
+            "information_schema.columns",
+            None
+            if system
+            else ~SQL.isin(
+                SQL("table_schema"), [SQL.str(d) for d in self.system_databases]
+            ),
+        )
+
     def ascii(self, sql: SQL[Char], /) -> SQL[int]:
         return SQL(f"ascii({sql})")
 
+    def length(self, sql: SQL[str], /) -> SQL[int]:
+        return SQL(f"char_length({sql})")
+
+    def group_concat(self, sql: SQL[str], /) -> SQL[str]:
+        return SQL(f"group_concat({sql} separator '')")
+
+    def base64(self, sql: SQL[str], /) -> SQL[str]:
+        return SQL(f"to_base64({sql})")
+
+    def compress(self, sql: SQL[str], /) -> SQL[str]:
+        return SQL(f"compress({sql})")
+
     def if_else(
         self, condition: SQL[bool], then: SQL[SQLType], otherwise: SQL[SQLType], /
     ) -> SQL[SQLType]:
@@ -135,6 +234,13 @@ class SQLite(DatabaseType):
             SQL("tbl_name") @ SQL.str(table),
         )
 
+    def get_schema(self, system: bool, /) -> Query:
+        return Query(
+            [SQL.str("main"), SQL.column("m.name"), SQL.column("p.name")],
+            "sqlite_master as m join pragma_table_info(m.name) as p",
+            SQL("m.type") @ SQL.str("table"),
+        )
+
     def unicode(self, sql: SQL[Char], /) -> SQL[int]:
         return SQL(f"unicode({sql})")
 
@@ -150,6 +256,15 @@ class SQLite(DatabaseType):
     def sleep(self, _: SQL[int], /) -> SQL[int]:
         raise NotImplementedError("SQLite hasn't any sleep function")
 
+    def hex(self, sql: SQL[str], /) -> SQL[str]:
+        return SQL(f"(case when {sql} is null then null else hex({sql}) end)")
+
+    def concat(self, *sqls: SQL[str]) -> SQL[str]:
+        return SQL(f"({'||'.join(str(sql) for sql in sqls)})")
+
+    def group_concat(self, sql: SQL[str], /) -> SQL[str]:
+        return SQL(f"group_concat({sql},'')")
+
     def parse_columns(self, columns: list[str]) -> list[str]:
         if not columns:
             return columns
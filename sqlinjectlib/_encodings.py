@@ -0,0 +1,94 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from base64 import b64decode
+from zlib import decompress
+from sqlinjectlib._databases import DatabaseType
+from sqlinjectlib._typedql import SQL
+
+
+class Encoding(ABC):
+    """Abstract class used to transport the extracted values in a different form
+
+    The values are encoded by the database and decoded after being extracted,
+    so binary and multibyte values are not corrupted
+    """
+
+    @abstractmethod
+    def encode(self, database: DatabaseType, sql: SQL[str], /) -> SQL[str]:
+        """Creates a query that encodes a value
+
+        - database: the type of the database
+        - sql: the query to encode
+        - returns: a query that returns the encoded value, null if the value is null
+        """
+        ...
+
+    @abstractmethod
+    def decode(self, value: str, /) -> bytes:
+        """Decodes an extracted value
+
+        - value: the encoded value
+        - returns: the bytes of the original value
+        - raises ValueError: if the value is not encoded correctly
+        """
+        ...
+
+    def text(self, value: str, /) -> str:
+        """Decodes an extracted value into text
+
+        - value: the encoded value
+        - returns: the original value, the bytes that are not utf-8 are kept as surrogates
+        - raises ValueError: if the value is not encoded correctly
+        """
+        return self.decode(value).decode("utf-8", "surrogateescape")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class HexEncoding(Encoding):
+    """Encoding of the bytes of a value as hexadecimal digits, it doubles the length"""
+
+    def encode(self, database: DatabaseType, sql: SQL[str], /) -> SQL[str]:
+        return database.hex(sql)
+
+    def decode(self, value: str, /) -> bytes:
+        return bytes.fromhex(value)
+
+
+class Base64Encoding(Encoding):
+    """Encoding of the bytes of a value in base64, it increases the length by a third"""
+
+    def encode(self, database: DatabaseType, sql: SQL[str], /) -> SQL[str]:
+        return database.base64(sql)
+
+    def decode(self, value: str, /) -> bytes:
+        return b64decode("".join(value.split()), validate=True)
+
+
+class CompressedEncoding(Encoding):
+    """Encoding of a value compressed by the database
+
+    Long text values become much shorter, short ones become longer
+    """
+
+    def __init__(self, transport: Encoding = HexEncoding(), /):
+        """
+        - transport: the encoding used for the compressed bytes, that can't be extracted as they are
+        """
+        self.__transport = transport
+
+    def encode(self, database: DatabaseType, sql: SQL[str], /) -> SQL[str]:
+        return self.__transport.encode(database, database.compress(sql))
+
+    def decode(self, value: str, /) -> bytes:
+        compressed = self.__transport.decode(value)
+        if not compressed:
+            return compressed
+        try:
+            return decompress(compressed[4:])
+        except Exception as e:
+            raise ValueError(f"Invalid compressed value '{value}'") from e
+
+    def __repr__(self) -> str:
+        return f"CompressedEncoding({self.__transport!r})"
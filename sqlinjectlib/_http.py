@@ -0,0 +1,207 @@
+from __future__ import annotations
+from collections.abc import Awaitable, Callable, Mapping
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
+from sqlinjectlib._typedql import SQL
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient, Response
+
+PLACEHOLDER = "{}"
+"""The text replaced by the injected expression in the parts of a request"""
+
+
+def client(
+    *, pool: int = 10, http2: bool = True, timeout: float = 30, **kwargs: Any
+) -> AsyncClient:
+    """Creates an HTTP client that keeps its connections open between requests
+
+    It can be shared between requests to use the same pool of connections
+
+    - pool: the most connections open at the same time
+    - http2: if HTTP/2 is used when the server supports it, ignored if the h2 package is missing
+    - timeout: the seconds after which a request fails
+    - kwargs: other arguments of httpx.AsyncClient
+    - returns: the client
+    - raises ImportError: if httpx is not installed
+    """
+    try:
+        from httpx import AsyncClient, Limits
+    except ImportError as e:
+        raise ImportError(
+            "The HTTP helpers require httpx, install sqlinjectlib[http]"
+        ) from e
+    if find_spec("h2") is None:
+        http2 = False
+    return AsyncClient(
+        limits=Limits(max_connections=pool, max_keepalive_connections=pool),
+        http2=http2,
+        timeout=timeout,
+        **kwargs,
+    )
+
+
+class HTTPRequest:
+    """HTTP request that carries an injected expression in a parameter, a cookie or a header
+
+    Every occurrence of PLACEHOLDER in the parts of the request is replaced by the expression
+    """
+
+    def __init__(
+        self,
+        url: str,
+        /,
+        *,
+        method: str = "GET",
+        params: Mapping[str, str] | None = None,
+        data: Mapping[str, str] | None = None,
+        cookies: Mapping[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
+        client: AsyncClient | None = None,
+    ):
+        """
+        - url: the url of the request
+        - method: the HTTP method of the request
+        - params: the query parameters
+        - data: the form fields of the body
+        - cookies: the cookies, sent as they are in the Cookie header
+        - headers: the headers
+        - client: the client used to send the request, it can be shared and it is not closed by aclose,
+            None to create one with the default options on the first request
+        """
+        self.__url = url
+        self.__method = method
+        self.__params = dict(params or {})
+        self.__data = dict(data) if data is not None else None
+        self.__cookies = dict(cookies or {})
+        self.__headers = dict(headers or {})
+        self.__client = client
+        self.__owned = False
+
+    async def send(self, sql: SQL[Any], /) -> Response:
+        """Sends the request with an injected expression
+
+        - sql: the expression to inject
+        - returns: the response
+        """
+        if self.__client is None:
+            self.__client = client()
+            self.__owned = True
+        payload = str(sql)
+
+        def fill(values: dict[str, str]) -> dict[str, str]:
+            return {
+                key: value.replace(PLACEHOLDER, payload)
+                for key, value in values.items()
+            }
+
+        headers = fill(self.__headers)
+        if self.__cookies:
+            headers["Cookie"] = "; ".join(
+                f"{key}={value}" for key, value in fill(self.__cookies).items()
+            )
+        return await self.__client.request(
+            self.__method,
+            self.__url.replace(PLACEHOLDER, payload),
+            params=fill(self.__params),
+            data=fill(self.__data) if self.__data is not None else None,
+            headers=headers,
+        )
+
+    def union(
+        self, extract: Callable[[Response], str | None], /
+    ) -> Callable[[SQL[str]], Awaitable[str | None]]:
+        """Creates the function of a UnionInjector
+
+        - extract: the function that finds the value in the response, like between
+        - returns: the injector function
+        """
+
+        async def inject(sql: SQL[str]) -> str | None:
+            return extract(await self.send(sql))
+
+        return inject
+
+    def blind(
+        self, matcher: Callable[[Response], bool], /
+    ) -> Callable[[SQL[bool]], Awaitable[bool]]:
+        """Creates the function of a BlindInjector
+
+        - matcher: the function that tells if the response is true, like contains
+        - returns: the injector function
+        """
+
+        async def inject(sql: SQL[bool]) -> bool:
+            return matcher(await self.send(sql))
+
+        return inject
+
+    def time(self) -> Callable[[SQL[int]], Awaitable[None]]:
+        """Creates the function of a TimeInjector
+
+        - returns: the injector function
+        """
+
+        async def inject(sql: SQL[int]) -> None:
+            await self.send(sql)
+
+        return inject
+
+    async def aclose(self) -> None:
+        """Closes the client if it was created by the request, a given client is left open"""
+        if self.__client is not None and self.__owned:
+            await self.__client.aclose()
+            self.__client = None
+            self.__owned = False
+
+    def __repr__(self) -> str:
+        return f"HTTPRequest({self.__url!r}, method={self.__method!r})"
+
+
+def contains(text: str, /) -> Callable[[Response], bool]:
+    """Matcher of the responses that contain a text
+
+    - text: the text to look for in the body
+    - returns: the matcher
+    """
+    return lambda response: text in response.text
+
+
+def status_code(code: int, /) -> Callable[[Response], bool]:
+    """Matcher of the responses with a status code
+
+    - code: the status code of the true responses
+    - returns: the matcher
+    """
+    return lambda response: response.status_code == code
+
+
+def longer_than(length: int, /) -> Callable[[Response], bool]:
+    """Matcher of the responses with a long body
+
+    - length: the length in bytes the body of the true responses exceeds
+    - returns: the matcher
+    """
+    return lambda response: len(response.content) > length
+
+
+def between(start: str, end: str, /) -> Callable[[Response], str | None]:
+    """Finds the value reflected in a response between two texts
+
+    - start: the text before the value
+    - end: the text after the value
+    - returns: a function that returns the value, None if the texts are missing
+    """
+
+    def extract(response: Response) -> str | None:
+        text = response.text
+        begin = text.find(start)
+        if begin == -1:
+            return None
+        begin += len(start)
+        finish = text.find(end, begin)
+        if finish == -1:
+            return None
+        return text[begin:finish]
+
+    return extract
@@ -0,0 +1,266 @@
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from json import dumps
+from math import ceil
+from random import Random
+from time import monotonic, time
+from typing import Any, TypeVar
+
+A = TypeVar("A")
+V = TypeVar("V")
+
+PHASE: ContextVar[str] = ContextVar("phase", default="query")
+SEEN = 4096
+"""The number of recent expressions remembered to tell the retries apart"""
+RESERVOIR = 4096
+"""The number of latencies sampled to compute the quantiles"""
+
+
+@contextmanager
+def phase(name: str, /) -> Iterator[None]:
+    """Labels the requests sent inside the context with a phase of the extraction
+
+    Nested phases replace the outer one
+
+    - name: the name of the phase
+    """
+    token = PHASE.set(name)
+    try:
+        yield
+    finally:
+        PHASE.reset(token)
+
+
+@dataclass(frozen=True, slots=True)
+class ProbeEvent:
+    """A call of an injector function"""
+
+    kind: str
+    """The kind of injector function: query, value, bit, digit or time"""
+    phase: str
+    """The phase of the extraction the call belongs to, like count, row or length"""
+    expression: str
+    """The text of the injected expression"""
+    result: Any
+    """The result of the call, None if it failed"""
+    error: str | None
+    """The name of the exception raised by the call, like CancelledError if it was cancelled, None if it succeeded"""
+    start: float
+    """The time the call started, in seconds since the epoch"""
+    latency: float
+    """The seconds the call took"""
+    in_flight: int
+    """The calls of the same injector function running when the call started, itself included"""
+    retry: bool
+    """If the same expression was among the last SEEN sent, for example to vote or to verify"""
+    bits: float
+    """The bits of information in the result"""
+
+
+Hook = Callable[[ProbeEvent], None]
+"""Function called with the event of every call of an injector function"""
+
+
+def result_bits(result: Any, /) -> float:
+    """The bits of information in a result, 8 for each character of the text"""
+    if isinstance(result, str):
+        return 8 * len(result)
+    if isinstance(result, list):
+        return sum(result_bits(r) for r in result)
+    return 0
+
+
+def instrument(
+    function: Callable[[A], Awaitable[V]],
+    kind: str,
+    hooks: Sequence[Hook],
+    bits: float | None = None,
+    /,
+) -> Callable[[A], Awaitable[V]]:
+    """Calls some hooks after every call of a function
+
+    - function: the injector function
+    - kind: the kind of injector function
+    - hooks: the hooks to call
+    - bits: the bits of information in every result, None to count them from the text of the result
+    - returns: a function that calls the hooks
+    """
+    seen: OrderedDict[str, None] = OrderedDict()
+    in_flight = 0
+
+    async def result(arg: A) -> V:
+        nonlocal in_flight
+        expression = str(arg)
+        retry = expression in seen
+        seen[expression] = None
+        seen.move_to_end(expression)
+        if len(seen) > SEEN:
+            seen.popitem(last=False)
+        in_flight += 1
+        event_in_flight = in_flight
+        start = time()
+        begin = monotonic()
+        value: Any = None
+        error: str | None = None
+        try:
+            value = await function(arg)
+            return value
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            in_flight -= 1
+            event = ProbeEvent(
+                kind,
+                PHASE.get(),
+                expression,
+                value,
+                error,
+                start,
+                monotonic() - begin,
+                event_in_flight,
+                retry,
+                0
+                if error is not None
+                else bits
+                if bits is not None
+                else result_bits(value),
+            )
+            for hook in hooks:
+                hook(event)
+
+    return result
+
+
+class Metrics:
+    """Hook that aggregates the calls of the injector functions
+
+    The memory used does not grow with the calls, the quantiles of the latency are computed
+    on a uniform sample of RESERVOIR calls
+    """
+
+    def __init__(self) -> None:
+        self.__requests = 0
+        self.__latencies: list[float] = []
+        self.__random = Random()
+        self.__phases: dict[str, tuple[int, float]] = {}
+        self.__errors = 0
+        self.__retries = 0
+        self.__bits = 0.0
+        self.__peak = 0
+        self.__start: float | None = None
+        self.__end: float | None = None
+
+    def __call__(self, event: ProbeEvent, /) -> None:
+        self.__requests += 1
+        if len(self.__latencies) < RESERVOIR:
+            self.__latencies.append(event.latency)
+        else:
+            index = self.__random.randrange(self.__requests)
+            if index < RESERVOIR:
+                self.__latencies[index] = event.latency
+        requests, latency = self.__phases.get(event.phase, (0, 0.0))
+        self.__phases[event.phase] = (requests + 1, latency + event.latency)
+        self.__errors += event.error is not None
+        self.__retries += event.retry
+        self.__bits += event.bits
+        self.__peak = max(self.__peak, event.in_flight)
+        end = event.start + event.latency
+        self.__start = (
+            event.start if self.__start is None else min(self.__start, event.start)
+        )
+        self.__end = end if self.__end is None else max(self.__end, end)
+
+    @property
+    def requests(self) -> int:
+        """The number of calls"""
+        return self.__requests
+
+    @property
+    def errors(self) -> int:
+        """The number of calls that failed"""
+        return self.__errors
+
+    @property
+    def retries(self) -> int:
+        """The number of calls with an expression already sent"""
+        return self.__retries
+
+    @property
+    def peak(self) -> int:
+        """The most calls of an injector function running at the same time"""
+        return self.__peak
+
+    @property
+    def requests_per_second(self) -> float:
+        """The calls divided by the time between the start of the first and the end of the last"""
+        if self.__start is None or self.__end is None or self.__end <= self.__start:
+            return 0
+        return self.requests / (self.__end - self.__start)
+
+    @property
+    def bits_per_request(self) -> float:
+        """The bits of information obtained by every call on average"""
+        return self.__bits / self.requests if self.requests else 0
+
+    @property
+    def phases(self) -> dict[str, tuple[int, float]]:
+        """The number of calls and their total latency for every phase"""
+        return dict(self.__phases)
+
+    def latency(self, quantile: float, /) -> float:
+        """A quantile of the latency of the calls
+
+        - quantile: the quantile between 0 and 1, like 0.5 for the median
+        - returns: the latency in seconds, zero if there are no calls,
+            estimated from a sample if there are more than RESERVOIR calls
+        - raises ValueError: if the quantile is not between 0 and 1
+        """
+        if not 0 <= quantile <= 1:
+            raise ValueError(
+                f"The quantile must be between 0 and 1, found '{quantile}'"
+            )
+        if not self.__latencies:
+            return 0
+        latencies = sorted(self.__latencies)
+        return latencies[max(ceil(quantile * len(latencies)) - 1, 0)]
+
+    def __str__(self) -> str:
+        lines = [
+            f"requests: {self.requests} ({self.requests_per_second:.1f}/s)",
+            f"latency: p50 {self.latency(0.5):.3f}s, p99 {self.latency(0.99):.3f}s",
+            f"bits per request: {self.bits_per_request:.2f}",
+            f"errors: {self.errors}, retries: {self.retries}, peak in flight: {self.peak}",
+        ]
+        for name, (requests, latency) in self.phases.items():
+            lines.append(f"{name}: {requests} requests, {latency:.3f}s")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"Metrics(requests={self.requests})"
+
+
+class Trace:
+    """Hook that writes every call of the injector functions to a JSONL file"""
+
+    def __init__(self, path: str, /):
+        """
+        - path: the file where the events are appended, it is created if missing
+        """
+        self.__path = path
+        self.__file = open(path, "a")
+
+    def __call__(self, event: ProbeEvent, /) -> None:
+        self.__file.write(dumps(asdict(event), default=str) + "\n")
+        self.__file.flush()
+
+    def close(self) -> None:
+        """Closes the file"""
+        self.__file.close()
+
+    def __repr__(self) -> str:
+        return f"Trace({self.__path!r})"
@@ -0,0 +1,251 @@
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from string import ascii_letters, digits, printable
+
+
+class CharacterModel(ABC):
+    """Abstract class used to predict the characters of the strings extracted by a blind injection
+
+    The more likely characters are found with fewer questions
+    """
+
+    @abstractmethod
+    def weights(self, prefix: str, index: int, /) -> dict[int, float]:
+        """Predicts a character of a string
+
+        - prefix: the characters of the string that are known before the character
+        - index: the index of the character, bigger than the length of the prefix
+            if some characters before it are still unknown
+        - returns: the relative likelihood of the codes of the character,
+            missing codes are unlikely, an empty dict if there is no prediction
+        """
+        ...
+
+    def update(self, value: str, /) -> None:
+        """Learns from a string that has been extracted
+
+        - value: the extracted string
+        """
+        ...
+
+
+class Charset(CharacterModel):
+    """Model of strings that use only a set of characters, all equally likely"""
+
+    def __init__(self, characters: str, /):
+        """
+        - characters: the characters that can appear in the strings
+        - raises ValueError: if there are no characters
+        """
+        if not characters:
+            raise ValueError("A charset needs at least one character")
+        self.__characters = frozenset(characters)
+
+    @property
+    def characters(self) -> frozenset[str]:
+        """The characters that can appear in the strings"""
+        return self.__characters
+
+    def weights(self, prefix: str, index: int, /) -> dict[int, float]:
+        return {ord(c): 1 for c in self.__characters}
+
+    def __repr__(self) -> str:
+        return f"Charset({''.join(sorted(self.__characters))!r})"
+
+
+DIGITS = Charset(digits)
+"""Decimal digits"""
+HEX = Charset(digits + "abcdef")
+"""Lowercase hexadecimal digits"""
+UPPER_HEX = Charset(digits + "ABCDEF")
+"""Uppercase hexadecimal digits"""
+BASE64 = Charset(ascii_letters + digits + "+/=")
+"""Base64 alphabet with padding"""
+PRINTABLE = Charset(printable)
+"""Printable ascii characters"""
+
+
+class AutoCharset(CharacterModel):
+    """Model that detects the charset of a string from its first characters"""
+
+    def __init__(
+        self,
+        charsets: Sequence[Charset] = (DIGITS, HEX, UPPER_HEX, BASE64, PRINTABLE),
+        /,
+        *,
+        sample: int = 4,
+    ):
+        """
+        - charsets: the charsets that can be detected
+        - sample: the number of characters extracted before detecting the charset
+        """
+        self.__charsets = sorted(charsets, key=lambda c: len(c.characters))
+        self.__sample = sample
+
+    def weights(self, prefix: str, index: int, /) -> dict[int, float]:
+        if len(prefix) < self.__sample:
+            return {}
+        characters = set(prefix)
+        for charset in self.__charsets:
+            if characters <= charset.characters:
+                return charset.weights(prefix, index)
+        return {}
+
+    def __repr__(self) -> str:
+        return f"AutoCharset({self.__charsets!r}, sample={self.__sample})"
+
+
+IDENTIFIERS = (
+    "information_schema",
+    "performance_schema",
+    "mysql",
+    "sys",
+    "main",
+    "sqlite_master",
+    "sqlite_sequence",
+    "schemata",
+    "tables",
+    "columns",
+    "schema_name",
+    "table_schema",
+    "table_name",
+    "column_name",
+    "users",
+    "user",
+    "accounts",
+    "account",
+    "customers",
+    "orders",
+    "products",
+    "items",
+    "posts",
+    "comments",
+    "messages",
+    "sessions",
+    "secrets",
+    "flags",
+    "flag",
+    "id",
+    "user_id",
+    "username",
+    "name",
+    "first_name",
+    "last_name",
+    "password",
+    "password_hash",
+    "passwd",
+    "hash",
+    "salt",
+    "email",
+    "mail",
+    "phone",
+    "address",
+    "role",
+    "admin",
+    "administrator",
+    "guest",
+    "root",
+    "test",
+    "title",
+    "content",
+    "description",
+    "value",
+    "secret",
+    "token",
+    "api_key",
+    "created_at",
+    "updated_at",
+    "timestamp",
+    "status",
+    "price",
+    "quantity",
+)
+"""Common names of databases, tables, columns and users"""
+
+PREFIXES = (
+    "$2y$10$",
+    "$2y$12$",
+    "$2b$10$",
+    "$2b$12$",
+    "$2a$10$",
+    "$argon2id$v=19$",
+    "$argon2i$v=19$",
+    "$6$",
+    "$5$",
+    "$1$",
+    "pbkdf2_sha256$",
+    "flag{",
+    "FLAG{",
+    "CTF{",
+    "https://",
+    "http://",
+)
+"""Common beginnings of hashes, flags and urls"""
+
+
+START = -1
+"""The code of the virtual character before the first one"""
+END = 0
+"""The code the blind injector reads after the last character"""
+
+
+class BigramModel(CharacterModel):
+    """Model that predicts a character from the one before it
+
+    The predictions come from a corpus and, if learning, from the strings already extracted
+    """
+
+    def __init__(
+        self,
+        corpus: Iterable[str] = IDENTIFIERS,
+        /,
+        *,
+        learn: bool = True,
+        smoothing: float = 0.5,
+    ):
+        """
+        - corpus: the strings used to build the model
+        - learn: if the extracted strings are added to the model
+        - smoothing: the weight given to the frequency of a character regardless of the one before it
+        """
+        self.__learn = learn
+        self.__smoothing = smoothing
+        self.__unigrams: Counter[int] = Counter()
+        self.__bigrams: defaultdict[int, Counter[int]] = defaultdict(Counter)
+        for value in corpus:
+            self.__add(value)
+
+    def __add(self, value: str) -> None:
+        codes = [ord(c) for c in value] + [END]
+        self.__unigrams.update(codes)
+        previous = START
+        for code in codes:
+            self.__bigrams[previous][code] += 1
+            previous = code
+
+    def weights(self, prefix: str, index: int, /) -> dict[int, float]:
+        total = sum(self.__unigrams.values())
+        if total == 0:
+            return {}
+        weights = {
+            code: self.__smoothing * count / total
+            for code, count in self.__unigrams.items()
+        }
+        if len(prefix) != index:
+            return weights
+        following = self.__bigrams.get(ord(prefix[-1]) if prefix else START)
+        if not following:
+            return weights
+        total = sum(following.values())
+        for code, count in following.items():
+            weights[code] += count / total
+        return weights
+
+    def update(self, value: str, /) -> None:
+        if self.__learn:
+            self.__add(value)
+
+    def __repr__(self) -> str:
+        return f"BigramModel(learn={self.__learn}, smoothing={self.__smoothing})"
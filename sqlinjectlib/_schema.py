@@ -0,0 +1,35 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Schema:
+    """Representation of the databases, tables and columns of a dbms"""
+
+    databases: dict[str, dict[str, list[str]]]
+    """The tables of each database with their columns"""
+
+    def tables(self, database: str, /) -> list[str]:
+        """The tables of a database
+
+        - database: the name of the database
+        - returns: the name of the tables, empty if the database is missing
+        """
+        return list(self.databases.get(database, {}))
+
+    def columns(self, database: str, table: str, /) -> list[str]:
+        """The columns of a table
+
+        - database: the name of the database of the table
+        - table: the name of the table
+        - returns: the name of the columns, empty if the table is missing
+        """
+        return list(self.databases.get(database, {}).get(table, []))
+
+    def __str__(self) -> str:
+        lines: list[str] = []
+        for database, tables in self.databases.items():
+            lines.append(database)
+            for table, columns in tables.items():
+                lines.append(f"  {table}: {', '.join(columns)}")
+        return "\n".join(lines)
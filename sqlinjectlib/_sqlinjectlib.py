@@ -1,6 +1,8 @@
 from __future__ import annotations
+from concurrent.futures import Executor
+from sqlinjectlib._metrics import Hook, phase
 from argparse import ArgumentParser
-from asyncio import run
+from asyncio import Task, create_task, run
 from sys import stderr
 from time import time
 from sqlinjectlib._typedql import (
@@ -14,17 +16,33 @@ from sqlinjectlib._typedql import (
     NoSuchTableError,
 )
 from sqlinjectlib._table import Table
+from sqlinjectlib._schema import Schema
 from sqlinjectlib._databases import DatabaseType, MySQL
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._packing import pack, pack_separated, packed, unpack, unpack_separated
+from sqlinjectlib._scheduler import MAX_IN_FLIGHT, Scheduler, limit
 from typing import Any, Literal, NoReturn, TypeVar, overload
 from re import compile
-from collections.abc import Callable, AsyncGenerator, Awaitable
-from sqlinjectlib._utils import wrap, print_test_result, list_is_not_none, Colors
+from collections.abc import Callable, AsyncGenerator, Awaitable, Sequence
+from sqlinjectlib._utils import (
+    RECENT,
+    single_flight,
+    wrap,
+    await_all,
+    discard,
+    print_test_result,
+    list_is_not_none,
+    Colors,
+)
 from importlib import import_module
+from json import JSONDecodeError, dumps, loads
+from os.path import exists
 
 HELP_REGEX = compile(r"help")
 LIST_DATABASES_REGEX = compile(r"list")
 LIST_TABLES_REGEX = compile(rf"list\s+(\w+)")
 LIST_COLUMNS_REGEX = compile(rf"columns\s+({TABLE_NAME})")
+SCHEMA_REGEX = compile(r"schema")
 EXIT = compile(r"exit")
 
 T = TypeVar("T")
@@ -44,14 +62,48 @@ class SQLInjector:
         self,
         injector: InjectorFunction[SimpleQuery, list[str | None]],
         *,
+        concurrent: bool = False,
         database_type: DatabaseType = MySQL(),
+        scheduler: Scheduler | None = None,
+        max_in_flight: int | None = MAX_IN_FLIGHT,
+        executor: Executor | None = None,
+        hooks: Sequence[Hook] = (),
+        cache: Cache | None = None,
+        pack: bool = False,
+        separated: bool = False,
     ):
         """
         - injector: function that given a query over a single column returns the list of values
+        - concurrent: if the function can be called multiple times concurrently to speed up
         - database_type: the type of the database you are injecting into
+        - scheduler: the scheduler that limits the requests sent with the injector, it can be shared
+        - max_in_flight: the most requests sent at the same time if concurrent and no scheduler is given,
+            None for no limit
+        - executor: the executor that runs the injector if it is not a coroutine function,
+            so that blocking injectors can run concurrently, None to run it in the event loop
+        - hooks: the functions called with the event of every call of the injector, like Metrics or Trace
+        - cache: the cache that keeps the results between sessions,
+            with it the recent results are also kept in memory
+        - pack: if all the columns of a row are read as a single value instead of a column at a time
+        - separated: if the packed columns are separated by a single character instead of prefixed by their length,
+            shorter but a truncated value is not detected
         """
         self.__database_type: DatabaseType = database_type
-        self.__injector = wrap(injector)
+        self.__concurrent = concurrent
+        self.__pack = pack
+        self.__separated = separated
+        self.__injector = wrap(
+            injector,
+            limit(scheduler, concurrent, max_in_flight),
+            executor,
+            hooks,
+            "query",
+        )
+        if cache is not None:
+            self.__injector = cache.wrap(self.__injector, "query")
+        self.__injector = single_flight(
+            self.__injector, RECENT if cache is not None else 0
+        )
 
     @property
     def database_type(self) -> DatabaseType:
@@ -97,6 +149,53 @@ class SQLInjector:
         result = self.database_type.parse_columns(result)
         return result
 
+    async def crawl_schema(self, *, system: bool = False) -> Schema:
+        """List all the databases with their tables and columns
+
+        A single query is used if the database type supports it, reading every row as a single value
+        so that the database, table and column of a row can't be mixed up with the ones of other rows,
+        otherwise the tables of a database are listed as soon as its name is extracted
+
+        - system: if the system databases are listed
+        - returns: the schema of the dbms
+        """
+        try:
+            query = self.database_type.get_schema(system)
+        except NotImplementedError:
+            return await self.__crawl(system)
+        databases: dict[str, dict[str, list[str]]] = {}
+        for database, table, column in await self.__packed_rows(self.__columns(query)):
+            if database is None or table is None or column is None:
+                raise ValueError(f"Some names are null in the schema, '{query}'")
+            databases.setdefault(database, {}).setdefault(table, []).append(column)
+        return Schema(databases)
+
+    async def __crawl(self, system: bool, /) -> Schema:
+        async def tables(database: str) -> dict[str, list[str]]:
+            names = await self.list_tables(database)
+            columns = await await_all(
+                [self.list_columns(name) for name in names], self.__concurrent
+            )
+            return dict(zip(names, columns))
+
+        query = self.database_type.get_databases()
+        pending: dict[str, Awaitable[dict[str, list[str]]]] = {}
+        try:
+            async for (name,) in self.stream(
+                Query([query.select], query.table, query.where)
+            ):
+                if name is None:
+                    raise ValueError("Some database names are null")
+                if system or name not in self.database_type.system_databases:
+                    pending[name] = (
+                        create_task(tables(name)) if self.__concurrent else tables(name)
+                    )
+            results = await await_all(pending.values(), self.__concurrent)
+        finally:
+            for awaitable in pending.values():
+                discard(awaitable)
+        return Schema(dict(zip(pending, results)))
+
     @overload
     async def query(self, query: SimpleQuery, /) -> list[str | None]:
         ...
@@ -117,6 +216,163 @@ class SQLInjector:
         """
         if isinstance(query, SimpleQuery):
             return await self.__injector(query)
+        query = await self.__select_all(query)
+        queries = self.__columns(query)
+        if self.__pack and len(queries) > 1:
+            return Table(
+                [str(q.select) for q in queries], await self.__packed_rows(queries)
+            )
+        columns = await await_all(
+            [self.__injector(q) for q in queries], self.__concurrent
+        )
+        tuples: list[list[str | None]] = []
+        for t in columns:
+            if len(tuples) != len(t):
+                if len(tuples) == 0:
+                    tuples = [[] for _ in t]
+                else:
+                    t = ["" for _ in tuples]
+            for row, elem in zip(tuples, t):
+                row.append(elem)
+        return Table([str(q.select) for q in queries], tuples)
+
+    async def count(self, query: SimpleQuery, /) -> int:
+        """Count the rows of a query in the attacked database
+
+        - query: the query to use
+        - returns: the number of rows of the query
+        """
+        with phase("count"):
+            result = await self.__injector(SimpleQuery(SQL.count(query)))
+        if len(result) != 1 or result[0] is None:
+            raise ValueError(f"Error getting number of rows, found {result}, '{query}'")
+        return int(result[0])
+
+    async def value(self, query: SimpleQuery, offset: int, /) -> str | None:
+        """Get a single value of a query in the attacked database
+
+        - query: the query to use
+        - offset: the index of the row of the value
+        - returns: the value in the given row
+        """
+        with phase("row"):
+            result = await self.__injector(SimpleQuery(SQL.subquery(query, offset)))
+        if len(result) != 1:
+            raise ValueError(f"Error getting a value, found {result}, '{query}'")
+        return result[0]
+
+    async def dump(self, query: Query | str, journal: str, /) -> Table:
+        """Perform a query in the attacked database saving every value in a journal
+
+        If the dump is interrupted, calling it again with the same query and journal
+        resumes it from the values already saved
+
+        - query: the query to use
+        - journal: the file where the values are saved, it is created if missing
+        - returns: the resulting table
+        - raises QuerySyntaxError: if the query is malformed
+        - raises ValueError: if the journal belongs to a different query
+        """
+        query = await self.__select_all(query)
+        queries = self.__columns(query)
+        text = str(query)
+        rows: int | None = None
+        values: dict[tuple[int, int], str | None] = {}
+        if exists(journal):
+            with open(journal) as file:
+                for line in file:
+                    try:
+                        entry = loads(line)
+                    except JSONDecodeError:
+                        continue
+                    if "query" in entry:
+                        if entry["query"] != text:
+                            raise ValueError(
+                                f"The journal '{journal}' belongs to a different query '{entry['query']}'"
+                            )
+                        rows = entry["rows"]
+                    else:
+                        values[entry["row"], entry["column"]] = entry["value"]
+        with open(journal, "a+") as file:
+            file.seek(0)
+            if file.read()[-1:] not in ("", "\n"):
+                file.write("\n")
+
+            def save(entry: dict[str, Any]) -> None:
+                file.write(dumps(entry) + "\n")
+                file.flush()
+
+            if rows is None:
+                rows = await self.count(queries[0])
+                save({"query": text, "rows": rows})
+
+            async def extract(row: int, column: int) -> str | None:
+                if (row, column) in values:
+                    return values[row, column]
+                value = await self.value(queries[column], row)
+                values[row, column] = value
+                save({"row": row, "column": column, "value": value})
+                return value
+
+            async def extract_row(row: int) -> list[str | None]:
+                if all((row, column) in values for column in range(len(queries))):
+                    return [values[row, column] for column in range(len(queries))]
+                if not self.__pack or len(queries) == 1:
+                    return await await_all(
+                        [extract(row, column) for column in range(len(queries))],
+                        self.__concurrent,
+                    )
+                result = await self.__packed_row(queries, row)
+                for column, value in enumerate(result):
+                    values[row, column] = value
+                    save({"row": row, "column": column, "value": value})
+                return result
+
+            tuples = [row async for row in self.__rows(rows, extract_row)]
+        return Table([str(q.select) for q in queries], tuples)
+
+    async def stream(
+        self, query: Query | str, /
+    ) -> AsyncGenerator[list[str | None], None]:
+        """Perform a query in the attacked database yielding every row as soon as it is extracted
+
+        Rows are extracted in order, if concurrent the next row is extracted while the current one is used
+
+        - query: the query to use
+        - returns: an asynchronous iterator over the rows of the query
+        - raises QuerySyntaxError: if the query is malformed
+        """
+        queries = self.__columns(await self.__select_all(query))
+        rows = await self.count(queries[0])
+
+        async def extract_row(row: int) -> list[str | None]:
+            if self.__pack and len(queries) > 1:
+                return await self.__packed_row(queries, row)
+            return await await_all(
+                [self.value(q, row) for q in queries], self.__concurrent
+            )
+
+        async for row in self.__rows(rows, extract_row):
+            yield row
+
+    async def __rows(
+        self, rows: int, row: Callable[[int], Awaitable[list[str | None]]]
+    ) -> AsyncGenerator[list[str | None], None]:
+        lookahead: Task[list[str | None]] | None = None
+        try:
+            for index in range(rows):
+                current = lookahead if lookahead is not None else row(index)
+                lookahead = (
+                    create_task(row(index + 1))
+                    if self.__concurrent and index + 1 < rows
+                    else None
+                )
+                yield await current
+        finally:
+            if lookahead is not None:
+                lookahead.cancel()
+
+    async def __select_all(self, query: Query | str, /) -> Query:
         if isinstance(query, str):
             query = Query.parse(query)
         if query.select is None:
@@ -130,18 +386,42 @@ class SQLInjector:
                 query.table,
                 query.where,
             )
+        return query
+
+    def __columns(self, query: Query, /) -> list[SimpleQuery]:
         assert query.select is not None
-        tuples: list[list[str | None]] = []
-        for s in query.select:
-            t = await self.__injector(SimpleQuery(s, query.table, query.where))
-            if len(tuples) != len(t):
-                if len(tuples) == 0:
-                    tuples = [[] for _ in t]
-                else:
-                    t = ["" for _ in tuples]
-            for row, elem in zip(tuples, t):
-                row.append(elem)
-        return Table([str(q) for q in query.select], tuples)
+        return [SimpleQuery(s, query.table, query.where) for s in query.select]
+
+    def __packed(self, queries: list[SimpleQuery], /) -> SimpleQuery:
+        return SimpleQuery(
+            (pack_separated if self.__separated else pack)(
+                self.database_type, [q.select for q in queries]
+            ),
+            queries[0].table,
+            queries[0].where,
+        )
+
+    async def __packed_rows(
+        self, queries: list[SimpleQuery], /
+    ) -> list[list[str | None]]:
+        with packed(len(queries)):
+            rows = await self.__injector(self.__packed(queries))
+        return [self.__unpack(value, len(queries)) for value in rows]
+
+    async def __packed_row(
+        self, queries: list[SimpleQuery], row: int, /
+    ) -> list[str | None]:
+        with packed(len(queries)):
+            value = await self.value(self.__packed(queries), row)
+        return self.__unpack(value, len(queries))
+
+    def __unpack(self, value: str | None, columns: int, /) -> list[str | None]:
+        result = (unpack_separated if self.__separated else unpack)(value or "")
+        if len(result) != columns:
+            raise ValueError(
+                f"Error unpacking a row, expected {columns} values, found '{value}'"
+            )
+        return result
 
     async def test(self) -> AsyncGenerator[tuple[str, bool], None]:
         """Tests if the injector gives the correct values
@@ -169,13 +449,19 @@ def main(injector: SQLInjector, main: Callable[[], Any]) -> NoReturn:
         "interactive", help="start an interactive session, the default"
     )
     subparsers.add_parser("test", help="test the injector")
+    schema_parser = subparsers.add_parser(
+        "schema", help="list all the databases with their tables and columns"
+    )
+    schema_parser.add_argument(
+        "--system", action="store_true", help="include the system databases"
+    )
     subparsers.add_parser(
         "main", help="execute the passed main function, it defaults to exit(1)"
     )
     exec_parser = subparsers.add_parser("exec", help="execute the given sql query")
     exec_parser.add_argument("sql_query", nargs="+", help="the sql query to execute")
     args = vars(parser.parse_args())
-    command: Literal["interactive", "test", "main", "exec"] = (
+    command: Literal["interactive", "test", "schema", "main", "exec"] = (
         args["command"] if args["command"] is not None else "interactive"
     )
     sql_query: list[str] = args["sql_query"] if "sql_query" in args else []
@@ -185,6 +471,8 @@ def main(injector: SQLInjector, main: Callable[[], Any]) -> NoReturn:
         function = interactive(injector)
     elif command == "test":
         function = test(injector)
+    elif command == "schema":
+        function = schema(injector, args["system"])
     else:
         function = main_function(main)
     run(function)
@@ -200,6 +488,10 @@ async def test(injector: SQLInjector) -> None:
         print_test_result(test, result)
 
 
+async def schema(injector: SQLInjector, system: bool) -> None:
+    print(await injector.crawl_schema(system=system))
+
+
 async def main_function(main_function: Callable[[], Any]) -> None:
     await wrap(main_function)()
 
@@ -216,6 +508,8 @@ async def interactive(injector: SQLInjector) -> None:
                     print(d)
             elif EXIT.fullmatch(line):
                 break
+            elif SCHEMA_REGEX.fullmatch(line):
+                print(await injector.crawl_schema())
             elif match := LIST_TABLES_REGEX.fullmatch(line):
                 for t in await injector.list_tables(match.group(1)):
                     print(t)
@@ -231,6 +525,9 @@ async def interactive(injector: SQLInjector) -> None:
                 print(
                     f"- {Colors.CYAN}columns [table]:{Colors.RESET} list all columns of table"
                 )
+                print(
+                    f"- {Colors.CYAN}schema:{Colors.RESET} list all the tables and columns of all databases"
+                )
                 print(f"- {Colors.RED}exit:{Colors.RESET} exit the program")
                 continue
             else:
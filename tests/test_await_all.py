@@ -0,0 +1,42 @@
+from asyncio import sleep
+from gc import collect
+from warnings import catch_warnings, simplefilter
+from pytest import raises
+from sqlinjectlib import UnionInjector, SimpleQuery, SQL
+
+
+async def test_cancel_on_error():
+    finished = 0
+
+    async def inject(sql: SQL[str]) -> str | None:
+        nonlocal finished
+        if "count" in str(sql):
+            return "4"
+        if "offset 0" in str(sql):
+            raise ConnectionError()
+        await sleep(0.05)
+        finished += 1
+        return "value"
+
+    injector = UnionInjector(inject, concurrent=True)
+    with raises(ConnectionError):
+        await injector.query(SimpleQuery(SQL.column("name"), "users"))
+    await sleep(0.1)
+    assert finished == 0
+
+
+async def test_close_on_error():
+    async def inject(sql: SQL[str]) -> str | None:
+        if "count" in str(sql):
+            return "4"
+        if "offset 1" in str(sql):
+            raise ConnectionError()
+        return "value"
+
+    injector = UnionInjector(inject)
+    with catch_warnings(record=True) as warnings:
+        simplefilter("always")
+        with raises(ConnectionError):
+            await injector.query(SimpleQuery(SQL.column("name"), "users"))
+        collect()
+    assert not [w for w in warnings if issubclass(w.category, RuntimeWarning)]
@@ -0,0 +1,60 @@
+from asyncio import sleep
+from concurrent.futures import ProcessPoolExecutor
+from os import getpid
+from pytest import raises
+from sqlinjectlib import Balancer, UnionInjector, SimpleQuery, SQL
+
+QUERY = SimpleQuery(SQL.column("name"), "users")
+
+
+def answer(sql: SQL[str]) -> str | None:
+    return "4" if "count" in str(sql) else "value"
+
+
+async def test_balancer():
+    calls = [0, 0, 0]
+
+    def endpoint(index: int, delay: float):
+        async def inject(sql: SQL[str]) -> str | None:
+            calls[index] += 1
+            await sleep(delay)
+            return answer(sql)
+
+        return inject
+
+    async def broken(sql: SQL[str]) -> str | None:
+        calls[2] += 1
+        raise ConnectionError()
+
+    balancer = Balancer(
+        [endpoint(0, 0.001), endpoint(1, 0.02), broken], failures=2, cooldown=60
+    )
+    injector = UnionInjector(balancer, concurrent=True)
+    for _ in range(5):
+        assert await injector.query(QUERY) == ["value"] * 4
+        injector = UnionInjector(balancer, concurrent=True)
+    assert calls[2] == 2
+    assert balancer.available == [True, True, False]
+    assert calls[0] > calls[1] > 0
+
+
+async def test_balancer_failure():
+    async def broken(sql: SQL[str]) -> str | None:
+        raise ConnectionError()
+
+    with raises(ConnectionError):
+        await UnionInjector(Balancer([broken, broken])).query(QUERY)
+    with raises(ValueError):
+        Balancer([])
+
+
+def process_answer(sql: SQL[str]) -> tuple[int, str | None]:
+    return (getpid(), answer(sql))
+
+
+async def test_balancer_processes():
+    with ProcessPoolExecutor(2) as executor:
+        balancer = Balancer([process_answer, process_answer], executor=executor)
+        pid, value = await balancer(SQL.str(SQL("name")))
+        assert pid != getpid()
+        assert value == "value"
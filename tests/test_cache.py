@@ -0,0 +1,25 @@
+from pathlib import Path
+from sqlinjectlib import Cache, SQL
+
+
+async def test_cache(tmp_path: Path):
+    path = str(tmp_path / "cache.db")
+    calls: list[str] = []
+
+    async def inject(sql: SQL[str]) -> str | None:
+        calls.append(str(sql))
+        return None if str(sql) == "null" else "value"
+
+    cache = Cache(path, "target")
+    function = cache.wrap(inject, "value")
+    assert await function(SQL("1")) == "value"
+    assert await function(SQL.none()) is None
+    cache.close()
+
+    cache = Cache(path, "target")
+    function = cache.wrap(inject, "value")
+    assert await function(SQL("1")) == "value"
+    assert await function(SQL.none()) is None
+    assert calls == ["1", "null"]
+    assert cache.get("value", "2") == (False, None)
+    assert Cache(path, "other").get("value", "1") == (False, None)
@@ -0,0 +1,38 @@
+from base64 import encodebytes
+from struct import pack
+from zlib import compress
+from pytest import raises
+from sqlinjectlib import (
+    HexEncoding,
+    Base64Encoding,
+    CompressedEncoding,
+    MySQL,
+    SQLite,
+    SQL,
+)
+
+TEXT = "héllo wörld " * 20
+
+
+def test_hex():
+    assert HexEncoding().decode(TEXT.encode().hex().upper()) == TEXT.encode()
+    assert str(HexEncoding().encode(MySQL(), SQL("a"))) == "hex(a)"
+    assert "is null" in str(HexEncoding().encode(SQLite(), SQL("a")))
+
+
+def test_base64():
+    value = encodebytes(TEXT.encode()).decode()
+    assert "\n" in value
+    assert Base64Encoding().decode(value) == TEXT.encode()
+    with raises(NotImplementedError):
+        Base64Encoding().encode(SQLite(), SQL("a"))
+
+
+def test_compressed():
+    data = TEXT.encode()
+    value = pack("<I", len(data)) + compress(data)
+    assert CompressedEncoding().decode(value.hex()) == data
+    assert CompressedEncoding().decode("") == b""
+    assert str(CompressedEncoding().encode(MySQL(), SQL("a"))) == "hex(compress(a))"
+    with raises(ValueError):
+        CompressedEncoding().decode("00000000ff")
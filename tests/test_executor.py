@@ -0,0 +1,16 @@
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep, time
+from sqlinjectlib import UnionInjector, SimpleQuery, SQL
+
+
+async def test_executor():
+    def inject(sql: SQL[str]) -> str | None:
+        sleep(0.05)
+        return "8" if "count" in str(sql) else "value"
+
+    query = SimpleQuery(SQL.column("name"), "users")
+    with ThreadPoolExecutor(8) as executor:
+        injector = UnionInjector(inject, concurrent=True, executor=executor)
+        start = time()
+        assert await injector.query(query) == ["value"] * 8
+        assert time() - start < 0.05 * 5
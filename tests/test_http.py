@@ -0,0 +1,112 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sqlite3 import connect
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlparse
+from pytest import fixture, importorskip
+from sqlinjectlib import (
+    BlindInjector,
+    UnionInjector,
+    SQLite,
+    HTTPRequest,
+    client,
+    contains,
+    status_code,
+    between,
+)
+
+importorskip("httpx")
+
+
+class Server(ThreadingHTTPServer):
+    connections = 0
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: Server
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/cookie":
+            sql = self.headers["Cookie"].removeprefix("id=")
+        else:
+            sql = parse_qs(url.query)["id"][0]
+        status = 200
+        with LOCK:
+            if url.path in ("/blind", "/cookie"):
+                found = DB.execute(f"select 1 where {sql}").fetchall() == [(1,)]
+                body = "found" if found else "missing"
+                status = 200 if found else 404
+            else:
+                body = f"<p>{DB.execute(f'select {sql}').fetchone()[0]}</p>"
+        content = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: object) -> None:
+        ...
+
+
+LOCK = Lock()
+DB = connect(":memory:", check_same_thread=False)
+DB.execute("create table users(id int, name text)")
+DB.execute("insert into users values (1,'admin'),(2,'guest')")
+
+
+@fixture(scope="module")
+def server() -> Iterator[Server]:
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+
+
+async def test_union(server: Server):
+    request = HTTPRequest(
+        f"http://127.0.0.1:{server.server_port}/union", params={"id": "{}"}
+    )
+    injector = UnionInjector(
+        request.union(between("<p>", "</p>")), database_type=SQLite()
+    )
+    result = await injector.query("select id,name from users")
+    assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+    await request.aclose()
+
+
+async def test_blind(server: Server):
+    server.connections = 0
+    shared = client(pool=4)
+    for matcher in [contains("found"), status_code(200)]:
+        request = HTTPRequest(
+            f"http://127.0.0.1:{server.server_port}/blind",
+            params={"id": "{}"},
+            client=shared,
+        )
+        injector = BlindInjector(
+            request.blind(matcher), database_type=SQLite(), concurrent=True
+        )
+        result = await injector.query("select name from users")
+        assert [list(row) for row in result] == [["admin"], ["guest"]]
+        await request.aclose()
+        assert not shared.is_closed
+    await shared.aclose()
+    assert server.connections <= 4
+
+
+async def test_cookie(server: Server):
+    request = HTTPRequest(
+        f"http://127.0.0.1:{server.server_port}/cookie", cookies={"id": "{}"}
+    )
+    injector = BlindInjector(request.blind(contains("found")), database_type=SQLite())
+    result = await injector.query("select name from users where id=1")
+    assert [list(row) for row in result] == [["admin"]]
+    await request.aclose()
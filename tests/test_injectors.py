@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import Any, Iterator, TypeAlias
+from collections.abc import Callable
 from sqlinjectlib import (
     BlindInjector,
     SQL,
@@ -9,12 +10,21 @@ from sqlinjectlib import (
     DatabaseType,
     UnionInjector,
     TimeInjector,
+    NaryInjector,
     SimpleQuery,
+    Query,
+    PRINTABLE,
+    UPPER_HEX,
+    HexEncoding,
 )
 from MySQLdb import connect as mysql_connect, Connection as MySQLConnection
-from pytest import fixture, FixtureRequest
+from pytest import fixture, FixtureRequest, raises
 from sqlite3 import connect as sqlite_connect, Connection as SQLiteConnection
 from tempfile import NamedTemporaryFile
+from pathlib import Path
+from random import Random
+from warnings import catch_warnings, simplefilter
+from gc import collect
 
 DB: TypeAlias = "MySQLConnection | SQLiteConnection"
 
@@ -54,18 +64,149 @@ def exec(db: DB, query: str) -> list[list[Any]]:
     return [list(row) for row in result]
 
 
-def blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+def execute(db: DB, query: str) -> None:
+    if isinstance(db, SQLiteConnection):
+        db.execute(query)
+    else:
+        db.query(query)
+
+
+@fixture(scope="module")
+def table(db: tuple[DB, DatabaseType]) -> str:
+    connection, _ = db
+    if isinstance(connection, SQLiteConnection):
+        name = "users"
+    else:
+        execute(connection, "create database if not exists test")
+        name = "test.users"
+    execute(connection, f"create table if not exists {name}(id int, name text)")
+    execute(connection, f"delete from {name}")
+    execute(connection, f"insert into {name} values (1,'admin'),(2,'guest')")
+    return name
+
+
+def blind_inject(db: DB) -> Callable[[SQL[bool]], bool]:
     def inject(sql: SQL[bool]) -> bool:
         return exec(db, f"select 1 where {sql}") == [[1]]
 
-    return BlindInjector(inject, database_type=type)
+    return inject
 
 
-def union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+def blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(blind_inject(db), database_type=type)
+
+
+def windowed_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db), database_type=type, concurrent=True, window=4
+    )
+
+
+def length_first_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db), database_type=type, concurrent=True, length_first=True
+    )
+
+
+def model_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(blind_inject(db), database_type=type, model=PRINTABLE)
+
+
+def dictionary_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db),
+        database_type=type,
+        concurrent=True,
+        dictionary=["root", "admin"],
+        prefixes=["g", "gu", "x"],
+    )
+
+
+def dictionary_hex_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db),
+        database_type=type,
+        dictionary=["root", "admin"],
+        prefixes=["g", "gu", "x"],
+        encoding=HexEncoding(),
+    )
+
+
+def dictionary_packed_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db),
+        database_type=type,
+        length_first=True,
+        dictionary=["root", "admin", "1"],
+        prefixes=["g", "gu", "x"],
+        pack=True,
+    )
+
+
+def union_inject(db: DB) -> Callable[[SQL[str]], str | None]:
     def inject(sql: SQL[str]) -> str | None:
         return exec(db, f"select {sql}")[0][0]
 
-    return UnionInjector(inject, database_type=type)
+    return inject
+
+
+def union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    return UnionInjector(union_inject(db), database_type=type)
+
+
+def concurrent_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    return UnionInjector(union_inject(db), database_type=type, concurrent=True)
+
+
+def packed_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    return UnionInjector(union_inject(db), database_type=type, pack=True)
+
+
+def packed_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db), database_type=type, concurrent=True, pack=True
+    )
+
+
+def hex_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    return UnionInjector(union_inject(db), database_type=type, encoding=HexEncoding())
+
+
+def hex_blind_injector(db: DB, type: DatabaseType) -> BlindInjector:
+    return BlindInjector(
+        blind_inject(db), database_type=type, model=UPPER_HEX, encoding=HexEncoding()
+    )
+
+
+def batch_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    return UnionInjector(union_inject(db), database_type=type, batch=8)
+
+
+def truncated_batch_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    inject = union_inject(db)
+
+    def truncated(sql: SQL[str]) -> str | None:
+        result = inject(sql)
+        return result if result is None else result[:20]
+
+    return UnionInjector(truncated, database_type=type, batch=8)
+
+
+def truncated_hex_batch_union_injector(db: DB, type: DatabaseType) -> UnionInjector:
+    inject = union_inject(db)
+
+    def truncated(sql: SQL[str]) -> str | None:
+        result = inject(sql)
+        return result if result is None else result[:41]
+
+    return UnionInjector(truncated, database_type=type, batch=8, encoding=HexEncoding())
+
+
+def nary_injector(db: DB, type: DatabaseType) -> NaryInjector:
+    def inject(sql: SQL[int]) -> int:
+        return int(exec(db, f"select {sql}")[0][0])
+
+    return NaryInjector(inject, 4, database_type=type, concurrent=True)
 
 
 def base_injector(db: DB, type: DatabaseType) -> SQLInjector:
@@ -83,9 +224,38 @@ def time_injector(db: DB, type: DatabaseType):
     return TimeInjector(inject, database_type=type, interval=1)
 
 
+def adaptive_time_injector(db: DB, type: DatabaseType):
+    def inject(sql: SQL[int]) -> None:
+        if not isinstance(db, SQLiteConnection):
+            exec(db, f"select {sql}")
+
+    return TimeInjector(inject, database_type=type, interval=1, adaptive=True)
+
+
 @fixture(
     scope="module",
-    params=[blind_injector, union_injector, base_injector, time_injector],
+    params=[
+        blind_injector,
+        windowed_blind_injector,
+        length_first_blind_injector,
+        model_blind_injector,
+        dictionary_blind_injector,
+        dictionary_hex_blind_injector,
+        dictionary_packed_blind_injector,
+        union_injector,
+        concurrent_union_injector,
+        packed_union_injector,
+        packed_blind_injector,
+        hex_union_injector,
+        hex_blind_injector,
+        batch_union_injector,
+        truncated_batch_union_injector,
+        truncated_hex_batch_union_injector,
+        nary_injector,
+        base_injector,
+        time_injector,
+        adaptive_time_injector,
+    ],
 )
 def injector(request: FixtureRequest, db: tuple[DB, DatabaseType]) -> SQLInjector:
     return request.param(db[0], db[1])
@@ -98,3 +268,228 @@ async def test_injector(injector: SQLInjector):
         return
     async for name, value in injector.test():
         assert value, f"{injector}: {name}"
+
+
+async def test_query(injector: SQLInjector, table: str):
+    if isinstance(injector, TimeInjector):
+        return
+    result = await injector.query(f"select id,name from {table}")
+    assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+
+
+async def test_dump(injector: SQLInjector, table: str, tmp_path: Path):
+    if isinstance(injector, TimeInjector):
+        return
+    journal = str(tmp_path / "journal.jsonl")
+    query = f"select id,name from {table}"
+    rows = [["1", "admin"], ["2", "guest"]]
+    assert [list(row) for row in await injector.dump(query, journal)] == rows
+    assert [list(row) for row in await injector.dump(query, journal)] == rows
+
+
+async def test_stream(injector: SQLInjector, table: str):
+    if isinstance(injector, TimeInjector):
+        return
+    rows = [row async for row in injector.stream(f"select id,name from {table}")]
+    assert rows == [["1", "admin"], ["2", "guest"]]
+
+
+async def test_integer(injector: SQLInjector):
+    if not isinstance(injector, UnionInjector) or isinstance(injector, TimeInjector):
+        return
+    assert await injector.integer(SQL.int(300)) == 300
+    assert await injector.integer(SQL.int(0)) == 0
+    assert await injector.integer(SQL.int(-1)) == -1
+    assert await injector.integer(SQL.int(-300)) == -300
+    with raises(ValueError):
+        await injector.integer(SQL.none())
+
+
+async def test_crawl_schema(injector: SQLInjector, table: str):
+    if isinstance(injector, TimeInjector):
+        return
+    database, name = ("main", table) if "." not in table else table.split(".")
+    schema = await injector.crawl_schema()
+    assert schema.columns(database, name) == ["id", "name"]
+
+
+async def test_dump_resume(db: tuple[DB, DatabaseType], table: str, tmp_path: Path):
+    connection, type = db
+    journal = str(tmp_path / "journal.jsonl")
+    query = f"select id,name from {table}"
+    inject = union_inject(connection)
+    calls: list[str] = []
+
+    def failing(sql: SQL[str]) -> str | None:
+        if len(calls) == 3:
+            raise ConnectionError()
+        calls.append(str(sql))
+        return inject(sql)
+
+    with raises(ConnectionError):
+        await UnionInjector(failing, database_type=type).dump(query, journal)
+    calls.clear()
+
+    def counted(sql: SQL[str]) -> str | None:
+        calls.append(str(sql))
+        return inject(sql)
+
+    result = await UnionInjector(counted, database_type=type).dump(query, journal)
+    assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+    assert len(calls) == 2 and all("offset 1" in sql for sql in calls)
+
+
+async def test_prefer_false(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+    inject = blind_inject(connection)
+    true_answers: dict[bool, int] = {}
+    for prefer_false in [False, True]:
+        questions: list[str] = []
+        answers = 0
+
+        def recorded(sql: SQL[bool]) -> bool:
+            nonlocal answers
+            questions.append(str(sql))
+            answer = inject(sql)
+            answers += answer
+            return answer
+
+        injector = BlindInjector(
+            recorded, database_type=type, prefer_false=prefer_false
+        )
+        result = await injector.query(f"select id,name from {table}")
+        assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+        assert any(q.startswith("(not ") for q in questions) == prefer_false
+        true_answers[prefer_false] = answers
+    assert true_answers[True] < true_answers[False]
+
+
+async def test_verify(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+    inject = blind_inject(connection)
+    extracted = 0
+    for seed in range(20):
+        random = Random(seed)
+
+        def noisy(sql: SQL[bool]) -> bool:
+            answer = inject(sql)
+            return not answer if random.random() < 0.05 else answer
+
+        injector = BlindInjector(
+            noisy,
+            database_type=type,
+            verify=True,
+            dictionary=[] if seed % 2 == 0 else ["root", "admin", "guest1"],
+            prefixes=[] if seed % 2 == 0 else ["gu", "x"],
+        )
+        try:
+            result = await injector.query(f"select id,name from {table}")
+        except ValueError:
+            continue
+        assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+        extracted += 1
+    assert extracted >= 16
+
+
+async def test_crawl(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+
+    class Crawled(MySQL):
+        def get_schema(self, system: bool, /) -> Query:
+            raise NotImplementedError()
+
+    class CrawledSQLite(SQLite):
+        def get_databases(self) -> SimpleQuery:
+            return SimpleQuery(SQL.column("name"), "pragma_database_list")
+
+        def get_columns(self, table: str, /) -> SimpleQuery:
+            return SimpleQuery(SQL.column("name"), f"pragma_table_info('{table}')")
+
+        def parse_columns(self, columns: list[str], /) -> list[str]:
+            return columns
+
+        def get_schema(self, system: bool, /) -> Query:
+            raise NotImplementedError()
+
+    crawled = CrawledSQLite() if isinstance(type, SQLite) else Crawled()
+
+    database, name = ("main", table) if "." not in table else table.split(".")
+    injector = UnionInjector(
+        union_inject(connection), database_type=crawled, concurrent=True
+    )
+    schema = await injector.crawl_schema()
+    assert schema.columns(database, name) == ["id", "name"]
+    assert not set(schema.databases) & set(crawled.system_databases)
+
+
+async def test_crawl_error(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+    inject = union_inject(connection)
+
+    class Named(type.__class__):  # type: ignore
+        def get_databases(self) -> SimpleQuery:
+            return SimpleQuery(SQL.column("name"), table)
+
+        def get_schema(self, system: bool, /) -> Query:
+            raise NotImplementedError()
+
+    def failing(sql: SQL[str]) -> str | None:
+        if "offset 1" in str(sql) and table in str(sql):
+            raise ConnectionError()
+        return inject(sql)
+
+    with catch_warnings(record=True) as warnings:
+        simplefilter("always")
+        with raises(ConnectionError):
+            await UnionInjector(failing, database_type=Named()).crawl_schema()
+        collect()
+    assert not [w for w in warnings if issubclass(w.category, RuntimeWarning)]
+
+
+async def test_pack(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+    query = Query([SQL.column("name"), SQL.none(), SQL.str("a|~s")], table, None)
+    for injector in [
+        UnionInjector(union_inject(connection), database_type=type, pack=True),
+        BlindInjector(blind_inject(connection), database_type=type, pack=True),
+        NaryInjector(
+            lambda sql: int(exec(connection, f"select {sql}")[0][0]),
+            4,
+            database_type=type,
+            pack=True,
+        ),
+    ]:
+        result = await injector.query(query)
+        assert [list(row) for row in result] == [
+            ["admin", None, "a|~s"],
+            ["guest", None, "a|~s"],
+        ]
+
+
+async def test_dictionary(db: tuple[DB, DatabaseType], table: str):
+    connection, type = db
+    inject = blind_inject(connection)
+    query = f"select id,name from {table}"
+    for options in [
+        {},
+        {"encoding": HexEncoding()},
+        {"pack": True},
+        {"pack": True, "length_first": True},
+        {"pack": True, "encoding": HexEncoding()},
+    ]:
+        requests: list[int] = []
+        for dictionary in [[], ["admin", "guest", "1", "2"]]:
+            calls = 0
+
+            def counted(sql: SQL[bool]) -> bool:
+                nonlocal calls
+                calls += 1
+                return inject(sql)
+
+            injector = BlindInjector(
+                counted, database_type=type, dictionary=dictionary, **options
+            )
+            result = await injector.query(query)
+            assert [list(row) for row in result] == [["1", "admin"], ["2", "guest"]]
+            requests.append(calls)
+        assert requests[1] < requests[0], options
@@ -0,0 +1,68 @@
+from asyncio import CancelledError, create_task, sleep
+from json import loads
+from pathlib import Path
+from sqlinjectlib import (
+    UnionInjector,
+    SimpleQuery,
+    SQL,
+    Metrics,
+    ProbeEvent,
+    Trace,
+)
+from sqlinjectlib._metrics import RESERVOIR
+
+
+async def test_metrics(tmp_path: Path):
+    path = str(tmp_path / "trace.jsonl")
+
+    async def inject(sql: SQL[str]) -> str | None:
+        return "2" if "count" in str(sql) else "value"
+
+    events: list[ProbeEvent] = []
+    metrics = Metrics()
+    trace = Trace(path)
+    injector = UnionInjector(inject, hooks=[metrics, trace, events.append])
+    assert await injector.query(SimpleQuery(SQL.column("name"), "users")) == [
+        "value",
+        "value",
+    ]
+    trace.close()
+    assert [event.phase for event in events] == ["count", "row", "row"]
+    assert all(event.kind == "value" and not event.retry for event in events)
+    assert metrics.requests == 3
+    assert metrics.bits_per_request == (8 + 40 + 40) / 3
+    assert metrics.phases["row"][0] == 2
+    assert metrics.latency(0.5) <= metrics.latency(0.99)
+    with open(path) as file:
+        assert [loads(line)["result"] for line in file] == ["2", "value", "value"]
+
+
+async def test_metrics_cancelled():
+    async def inject(sql: SQL[str]) -> str | None:
+        await sleep(1)
+        return "value"
+
+    events: list[ProbeEvent] = []
+    injector = UnionInjector(inject, hooks=[events.append])
+    task = create_task(injector.count(SimpleQuery(SQL.column("name"), "users")))
+    await sleep(0.01)
+    task.cancel()
+    try:
+        await task
+    except CancelledError:
+        pass
+    assert [event.error for event in events] == ["CancelledError"]
+
+
+def test_metrics_bounded():
+    metrics = Metrics()
+    requests = 3 * RESERVOIR
+    for i in range(requests):
+        metrics(
+            ProbeEvent("value", "row", "1", "1", None, 0, i / requests, 1, False, 8)
+        )
+    assert metrics.requests == requests
+    assert metrics.phases == {
+        "row": (requests, sum(i / requests for i in range(requests)))
+    }
+    assert abs(metrics.latency(0.5) - 0.5) < 0.05
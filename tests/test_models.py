@@ -0,0 +1,25 @@
+from sqlinjectlib import AutoCharset, BigramModel, DIGITS, HEX, PRINTABLE
+
+
+def test_auto_charset():
+    model = AutoCharset(sample=2)
+    assert model.weights("1", 1) == {}
+    assert model.weights("12", 2) == DIGITS.weights("", 0)
+    assert model.weights("1f", 2) == HEX.weights("", 0)
+    assert model.weights("a b", 3) == PRINTABLE.weights("", 0)
+    assert model.weights("\x00\x01", 2) == {}
+
+
+def test_bigram_model():
+    model = BigramModel(["ab", "ab", "ac"])
+    first = model.weights("", 0)
+    assert max(first, key=first.__getitem__) == ord("a")
+    second = model.weights("a", 1)
+    assert max(second, key=second.__getitem__) == ord("b")
+    model.update("ac")
+    model.update("ac")
+    second = model.weights("a", 1)
+    assert max(second, key=second.__getitem__) == ord("c")
+    assert model.weights("a", 2) == BigramModel(["ab", "ab", "ac", "ac", "ac"]).weights(
+        "", 5
+    )
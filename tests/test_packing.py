@@ -0,0 +1,42 @@
+from sqlite3 import connect
+from sqlinjectlib import SQL, SQLite
+from sqlinjectlib._packing import (
+    pack,
+    pack_separated,
+    unpack,
+    unpack_separated,
+    escape,
+    boundary,
+)
+
+VALUES = [None, "", "admin", "a|b", "~", "~s", "|~|", "x~"]
+
+
+def select(sql: SQL[str]) -> str:
+    with connect(":memory:") as connection:
+        return connection.execute(f"select {sql}").fetchone()[0]
+
+
+def literals() -> list[SQL[str]]:
+    return [SQL.none() if value is None else SQL.str(value) for value in VALUES]
+
+
+def test_pack():
+    assert unpack(select(pack(SQLite(), literals()))) == VALUES
+
+
+def test_pack_separated():
+    text = select(pack_separated(SQLite(), literals()))
+    assert text == "|".join(escape(value) for value in VALUES)
+    assert unpack_separated(text) == VALUES
+    assert unpack_separated(select(pack_separated(SQLite(), [SQL.none()]))) == [None]
+
+
+def test_boundary():
+    text = select(pack_separated(SQLite(), literals()))
+    starts = [0]
+    for value in VALUES:
+        starts.append(starts[-1] + len(escape(value)) + 1)
+    for index in range(len(text) + 1):
+        expected = starts.index(index) if index in starts else None
+        assert boundary(text[:index]) == expected
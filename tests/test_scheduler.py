@@ -0,0 +1,77 @@
+from asyncio import gather, sleep
+from time import monotonic
+from sqlinjectlib import (
+    Scheduler,
+    priority,
+    MAX_IN_FLIGHT,
+    UnionInjector,
+    SimpleQuery,
+    SQL,
+)
+
+
+async def test_max_in_flight():
+    scheduler = Scheduler(max_in_flight=2)
+    peak = 0
+
+    async def request() -> None:
+        nonlocal peak
+        async with scheduler.slot():
+            peak = max(peak, scheduler.in_flight)
+            await sleep(0.01)
+
+    await gather(*[request() for _ in range(10)])
+    assert peak == 2
+    assert scheduler.in_flight == 0
+
+
+async def test_priority():
+    scheduler = Scheduler(max_in_flight=1)
+    order: list[int] = []
+
+    async def request(value: int) -> None:
+        with priority(value):
+            async with scheduler.slot():
+                order.append(value)
+                await sleep(0.01)
+
+    await gather(*[request(value) for value in [0, 3, 1, 2]])
+    assert order == [0, 1, 2, 3]
+
+
+async def test_rate():
+    rate = 50
+    scheduler = Scheduler(rate=rate)
+    starts: list[float] = []
+
+    async def request() -> None:
+        async with scheduler.slot():
+            starts.append(monotonic())
+
+    await gather(*[request() for _ in range(10)])
+    starts.sort()
+    # the event loop may wake up to a millisecond early
+    assert all(b - a >= 1 / rate - 0.001 for a, b in zip(starts, starts[1:]))
+
+
+async def test_default_max_in_flight():
+    for max_in_flight, expected in [(MAX_IN_FLIGHT, MAX_IN_FLIGHT), (None, 20)]:
+        in_flight = 0
+        peak = 0
+
+        async def inject(sql: SQL[str]) -> str | None:
+            nonlocal in_flight, peak
+            if "count" in str(sql):
+                return "20"
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await sleep(0.01)
+            in_flight -= 1
+            return "value"
+
+        injector = UnionInjector(inject, concurrent=True, max_in_flight=max_in_flight)
+        assert (
+            await injector.query(SimpleQuery(SQL.column("name"), "users"))
+            == ["value"] * 20
+        )
+        assert peak == expected
@@ -0,0 +1,62 @@
+from asyncio import gather, sleep
+from pathlib import Path
+from sqlinjectlib import SQLInjector, UnionInjector, SimpleQuery, SQL, SQLite, Cache
+
+
+async def test_single_flight():
+    calls: list[str] = []
+
+    async def inject(sql: SQL[str]) -> str | None:
+        calls.append(str(sql))
+        await sleep(0.01)
+        return "1"
+
+    injector = UnionInjector(inject)
+    query = SimpleQuery(SQL.column("name"), "users")
+    assert await gather(*[injector.count(query) for _ in range(5)]) == [1] * 5
+    assert len(calls) == 1
+    assert await injector.count(query) == 1
+    assert len(calls) == 2
+
+
+async def test_single_flight_error():
+    calls = 0
+
+    async def inject(sql: SQL[str]) -> str | None:
+        nonlocal calls
+        calls += 1
+        await sleep(0.01)
+        if calls == 1:
+            raise ConnectionError()
+        return "1"
+
+    injector = UnionInjector(inject)
+    query = SimpleQuery(SQL.column("name"), "users")
+    first, second = await gather(
+        injector.count(query), injector.count(query), return_exceptions=True
+    )
+    assert isinstance(first, ConnectionError)
+    assert second == 1
+    assert calls == 2
+
+
+async def test_single_flight_copy(tmp_path: Path):
+    calls = 0
+
+    async def inject(query: SimpleQuery) -> list[str | None]:
+        nonlocal calls
+        calls += 1
+        await sleep(0.01)
+        return ["users"]
+
+    cache = Cache(str(tmp_path / "cache.db"), "target")
+    injector = SQLInjector(inject, database_type=SQLite(), cache=cache)
+    first, second = await gather(
+        injector.list_tables("main"), injector.list_tables("main")
+    )
+    first.append("bogus")
+    assert second == ["users"]
+    (await injector.list_tables("main")).append("bogus")
+    assert await injector.list_tables("main") == ["users"]
+    assert calls == 1
+    cache.close()
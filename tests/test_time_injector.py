@@ -0,0 +1,71 @@
+from __future__ import annotations
+from asyncio import sleep, wait_for
+from sqlite3 import connect
+from sqlinjectlib import SQL, SQLite, TimeInjector
+
+LATENCY = 0.01
+
+
+class SleepSQLite(SQLite):
+    def sleep(self, time: SQL[int], /) -> SQL[int]:
+        return SQL(f"sleep({time})")
+
+
+async def test_adaptive_concurrent():
+    pauses: list[float] = []
+    in_flight = 0
+
+    def record(time: float) -> int:
+        pauses.append(time)
+        return 0
+
+    connection = connect(":memory:")
+    connection.create_function("sleep", 1, record)
+    connection.execute("create table users(id int, name text)")
+    connection.execute("insert into users values (1,'admin'),(2,'guest')")
+
+    async def inject(sql: SQL[int]) -> None:
+        nonlocal in_flight
+        in_flight += 1
+        pauses.clear()
+        connection.execute(f"select {sql}").fetchall()
+        pause = sum(pauses)
+        await sleep(LATENCY * in_flight + pause)
+        in_flight -= 1
+
+    injector = TimeInjector(
+        inject,
+        database_type=SleepSQLite(),
+        concurrent=True,
+        interval=1,
+        adaptive=True,
+    )
+    result = await wait_for(injector.query("select name from users"), 30)
+    assert [list(row) for row in result] == [["admin"], ["guest"]]
+    assert injector.pause < 1
+
+
+async def test_dictionary():
+    pauses: list[float] = []
+    connection = connect(":memory:")
+    connection.create_function("sleep", 1, lambda time: pauses.append(time) or 0)
+    connection.execute("create table users(id int, name text)")
+    connection.execute("insert into users values (1,'admin'),(2,'guest')")
+    requests: list[int] = []
+    for dictionary in [[], ["admin", "guest"]]:
+        calls = 0
+
+        async def inject(sql: SQL[int]) -> None:
+            nonlocal calls
+            calls += 1
+            pauses.clear()
+            connection.execute(f"select {sql}").fetchall()
+            await sleep(sum(pauses))
+
+        injector = TimeInjector(
+            inject, database_type=SleepSQLite(), interval=0.02, dictionary=dictionary
+        )
+        result = await wait_for(injector.query("select name from users"), 30)
+        assert [list(row) for row in result] == [["admin"], ["guest"]]
+        requests.append(calls)
+    assert requests[1] < requests[0]